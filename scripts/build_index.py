@@ -1,4 +1,6 @@
 import os
+import sys
+import math
 import time
 import vertexai
 from config import Config
@@ -8,6 +10,7 @@ from langchain_community.vectorstores import FAISS
 from genai_embeddings import GenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 import hashlib
 import json
 from rich.console import Console, Group, RenderableType
@@ -32,6 +35,11 @@ INDEX_DIR = Config.VECTOR_STORE_PREFIX
 BATCH_SIZE = 5  # Reduced for gemini-embedding-001 quotas
 BATCH_DELAY = 5 # Seconds to wait between batches (User: "take a break")
 CACHE_FILE = "indexing_cache.json"
+# Below this many vectors IVF can't be trained well; fall back to a flat fp16 index
+IVFPQ_MIN_VECTORS = 25_000
+# PQ code size in bytes per vector (3 KB+ as float32 for d=768). Lossy: recall is
+# recovered at query time via Config.FAISS_NPROBE.
+PQ_CODE_BYTES = 64
 
 def get_file_hash(file_path: str) -> str:
     """Returns MD5 hash of a file."""
@@ -263,19 +271,79 @@ def sync_to_gcs(local_dir: str, log_fn=None):
                 printer(f"🪣 Creating bucket: {b_name}", "yellow")
                 client.create_bucket(b_name, location=LOCATION)
             
+        source_root = os.path.dirname(os.path.normpath(local_dir))
+        blob_paths = []
         for root, _, files in os.walk(local_dir):
             for file in files:
-                local_path = os.path.join(root, file)
-                rel_path = os.path.relpath(local_path, os.path.dirname(local_dir))
-                blob_path = rel_path.replace("\\", "/") 
-                
-                blob = client.bucket(bucket_name).blob(blob_path)
-                blob.upload_from_filename(local_path)
+                rel_path = os.path.relpath(os.path.join(root, file), source_root)
+                blob_paths.append(rel_path.replace("\\", "/"))
+
+        # Parallel upload: shards no longer pay one serial round-trip each
+        results = transfer_manager.upload_many_from_filenames(
+            client.bucket(bucket_name),
+            blob_paths,
+            source_directory=source_root,
+            max_workers=Config.GCS_SYNC_WORKERS,
+            worker_type=transfer_manager.THREAD
+        )
+        failed = 0
+        for blob_path, result in zip(blob_paths, results):
+            if isinstance(result, Exception):
+                failed += 1
+                printer(f"   ❌ {blob_path}: {result}", "red")
+            else:
                 printer(f"   ✅ {blob_path}", "dim")
+        if failed:
+            printer(f"❌ GCS Sync Incomplete: {failed} upload(s) failed. Index not republished.", "red")
+            return
+
+        # Publish marker goes last: agents compare its generation (one HEAD) before re-listing the prefix
+        marker_path = f"{os.path.basename(os.path.normpath(local_dir))}/_MANIFEST.json"
+        client.bucket(bucket_name).blob(marker_path).upload_from_string(
+            json.dumps({"timestamp": time.time()}), content_type="application/json"
+        )
         
         printer("✅ GCS Sync Complete.", "green")
     except Exception as e:
         printer(f"❌ GCS Sync Failed: {e}", "red")
 
+def compact_index(index_dir: str = INDEX_DIR):
+    """
+    One-time rewrite of the flat float32 index. Large corpora become IVF-PQ
+    (sub-linear search, PQ_CODE_BYTES per vector); small ones become fp16 scalar-quantized
+    (exact scan, half the RAM). Docstore ids are positional, so the pickle is untouched.
+    """
+    import faiss
+
+    index_path = os.path.join(index_dir, "index.faiss")
+    flat = faiss.read_index(index_path)
+    if not isinstance(flat, faiss.IndexFlat):
+        console.print(f"⏩ {index_path} is already compacted ({type(flat).__name__}).", style="dim")
+        return
+
+    n, d = flat.ntotal, flat.d
+    if n == 0:
+        return
+    xb = flat.reconstruct_n(0, n)
+
+    if n >= IVFPQ_MIN_VECTORS:
+        nlist = int(4 * math.sqrt(n))
+        m = max(m for m in range(1, PQ_CODE_BYTES + 1) if d % m == 0)
+        quantizer = faiss.IndexFlatL2(d)
+        index = faiss.IndexIVFPQ(quantizer, d, nlist, m, 8)
+    else:
+        index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_fp16)
+
+    console.print(f"🗜️  Compacting {n} vectors ({d}d) into {type(index).__name__}...", style="cyan")
+    index.train(xb)
+    index.add(xb)
+    faiss.write_index(index, index_path)
+    console.print(f"✅ Wrote {index_path}", style="green")
+
+
 if __name__ == "__main__":
-    build_index()
+    if "--compact" in sys.argv:
+        compact_index()
+        sync_to_gcs(INDEX_DIR)
+    else:
+        build_index()
@@ -2,15 +2,19 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import json
-from visions.core.agent import VisionsAgent, Config
+from google.genai import types
+from visions.core.agent import VisionsAgent, Config, RoutingResult
 
 class TestSmartRouter(unittest.TestCase):
     def setUp(self):
         # Mock GCP init to avoid real creds during unit test
-        with patch('visions.core.agent.vertexai.init'), \
-             patch('visions.core.agent.genai.Client'), \
-             patch('visions.core.agent.CloudMemoryManager'):
+        with patch('vertexai.init'), \
+             patch('visions.core.agent.vertex_client'), \
+             patch('visions.core.agent.KnowledgeRetriever'), \
+             patch('visions.modules.mem_store.memory_cloud.CloudMemoryManager'):
             self.agent = VisionsAgent(project="test-project", location="global")
+            self.agent.set_up()
+        self.agent.retriever.search.return_value = ""
             
     def test_routing_tiers(self):
         """Verify 6-Level Reasoning Heuristic Ladder"""
@@ -30,33 +34,39 @@ class TestSmartRouter(unittest.TestCase):
 
         for complexity, high_risk, expected_tier in test_cases:
             # Mock the _triage_query response
-            self.agent._triage_query = MagicMock(return_value={
-                "complexity": complexity,
-                "is_high_risk": high_risk,
-                "needs_search": False
-            })
+            self.agent._triage_query = MagicMock(return_value=RoutingResult(
+                complexity=complexity,
+                is_high_risk=high_risk,
+                needs_search=False
+            ))
 
-            # Mock generation to avoid API call
+            # Mock the synthesis stream to avoid API call
             mock_client = MagicMock()
-            mock_response = MagicMock()
-            mock_response.text = "Mock Response"
-            mock_client.models.generate_content.return_value = mock_response
+            mock_chunk = types.GenerateContentResponse(candidates=[types.Candidate(
+                content=types.Content(role="model", parts=[types.Part(text="Mock Response")])
+            )])
+            mock_client.models.generate_content_stream.side_effect = lambda **kwargs: iter([mock_chunk])
             self.agent._get_client = MagicMock(return_value=mock_client)
             
-            # We need to spy on the logging or internal state. 
-            # Since I modified the code to log "➡️ Routing Decision: {tier}", 
-            # we can verify logic by inspecting the args passed to _get_client 
-            # and the ThinkingConfig.
-            
-            self.agent.query("test query")
+            # Non-trivial question: short chatter takes the fast path and never consults triage.
+            # The chosen tier is read back from the "➡️ Routing Decision" log line.
+            with self.assertLogs("visions-core", level="INFO") as logs:
+                answer = self.agent.query("Explain how the heuristic ladder routes this request")
+            self.assertEqual(answer, "Mock Response")
+            self.agent._triage_query.assert_called_once()
             
             # Verify Model Selection
-            model_called = self.agent._get_client.call_args[0][0]
+            stream_kwargs = mock_client.models.generate_content_stream.call_args.kwargs
+            model_called = stream_kwargs['model']
             
             # Verify Thinking Level
-            # access the call arguments to generate_content
-            config_arg = mock_client.models.generate_content.call_args[1]['config']
-            thinking_level = config_arg.thinking_config.thinking_level
+            routed = [line for line in logs.output if "Routing Decision: " in line]
+            tier_name = routed[0].split("Routing Decision: ", 1)[1]
+            self.assertTrue(tier_name.startswith(expected_tier), f"Tier mismatch: {tier_name}")
+            thinking_level = next(level for _, level, name in VisionsAgent._TIERS if name == tier_name)
+            # Thoughts are only requested from Pro
+            config_arg = stream_kwargs['config']
+            self.assertEqual(config_arg.thinking_config is not None, model_called == Config.MODEL_PRO)
             
             # Determine Expected Model/Thinking from Tier Name
             if "Pro" in expected_tier:
@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures.
+`clock` swaps a module's `time` for a fake one, so nothing really sleeps. Test files pick
+the module by defining a `clocked_module` fixture.
+"""
+
+import pytest
+
+
+class FakeClock:
+    """Stands in for the `time` module: sleep() just advances monotonic()."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.slept = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(clocked_module, monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(clocked_module, "time", fake)
+    return fake
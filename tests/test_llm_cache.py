@@ -0,0 +1,53 @@
+"""
+Unit tests for the exact-match media cache (LLMCache).
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from visions.core.llm_cache import LLMCache
+
+
+class TestKey:
+    def test_stable_and_order_independent(self):
+        assert LLMCache.key(model="m", prompt="p") == LLMCache.key(prompt="p", model="m")
+
+    def test_any_field_changes_the_key(self):
+        base = LLMCache.key(model="m", prompt="p", mime="image/png")
+        assert LLMCache.key(model="m", prompt="p!", mime="image/png") != base
+        assert LLMCache.key(model="m2", prompt="p", mime="image/png") != base
+        assert LLMCache.key(model="m", prompt="p", mime="image/jpeg") != base
+
+
+class TestRoundTrip:
+    def test_miss_then_hit(self, tmp_path):
+        cache = LLMCache(cache_dir=tmp_path)
+        key = LLMCache.key(model="m", prompt="a cat")
+        assert cache.get(key) is None
+        cache.put(key, b"\x89PNG...")
+        assert cache.get(key) == b"\x89PNG..."
+
+    def test_disk_tier_survives_a_new_instance(self, tmp_path):
+        key = LLMCache.key(model="m", prompt="a cat")
+        LLMCache(cache_dir=tmp_path).put(key, b"bytes")
+        assert (tmp_path / f"{key}.bin").read_bytes() == b"bytes"
+        assert not list(tmp_path.glob("*.tmp"))  # Atomic write leaves no temp file behind
+        assert LLMCache(cache_dir=tmp_path).get(key) == b"bytes"
+
+    def test_memory_tier_is_lru_bounded(self, tmp_path):
+        cache = LLMCache(cache_dir=tmp_path, memory_items=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, name.encode())
+        assert list(cache._memory) == ["b", "c"]
+        assert cache.get("a") == b"a"  # Evicted from memory, still served from disk
+        assert list(cache._memory) == ["c", "a"]
+
+    def test_unwritable_disk_still_serves_from_memory(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("file where the cache dir should be")
+        cache = LLMCache(cache_dir=blocker / "cache")
+        cache.put("k", b"v")  # Best-effort: no exception
+        assert cache.get("k") == b"v"
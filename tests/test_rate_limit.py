@@ -0,0 +1,105 @@
+"""
+Unit tests for client-side rate limiting (TokenBucket, SlidingWindowLimiter).
+Runs on a fake clock: nothing here really sleeps.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from visions.core import rate_limit
+from visions.core.rate_limit import RateLimitExceeded, SlidingWindowLimiter, TokenBucket
+
+
+@pytest.fixture
+def clocked_module():
+    return rate_limit
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self, clock):
+        bucket = TokenBucket(capacity=3, refill_rate=0.5)
+        assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 0.0]
+        # Short callers queue behind each other: 1 and 2 tokens in debt
+        assert bucket.take() == pytest.approx(2.0)
+        assert bucket.take() == pytest.approx(4.0)
+
+    def test_refills_up_to_capacity(self, clock):
+        bucket = TokenBucket(capacity=2, refill_rate=1.0)
+        bucket.take()
+        bucket.take()
+        clock.advance(60)  # Far more than capacity worth of refill
+        assert [bucket.take() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.take() == pytest.approx(1.0)
+
+    def test_cost(self, clock):
+        bucket = TokenBucket(capacity=4, refill_rate=2.0)
+        assert bucket.take(cost=4) == 0.0
+        assert bucket.take(cost=2) == pytest.approx(1.0)
+
+
+class TestSlidingWindowLimiter:
+    def test_under_rpm_never_waits(self, clock):
+        limiter = SlidingWindowLimiter()
+        assert [limiter.allow("k", rpm=5) for _ in range(5)] == [0.0] * 5
+        assert clock.slept == []
+
+    def test_full_window_waits_for_next(self, clock):
+        limiter = SlidingWindowLimiter()
+        limiter.allow("k", rpm=2)
+        limiter.allow("k", rpm=2)
+        waited = limiter.allow("k", rpm=2)
+        # Next window opens at 60s; the previous window's weight then has to decay a little
+        assert 60.0 <= waited < 61.0
+        assert sum(clock.slept) == pytest.approx(waited)
+
+    def test_previous_window_is_weighted(self, clock):
+        limiter = SlidingWindowLimiter()
+        for _ in range(10):
+            limiter.allow("k", rpm=10)
+        clock.advance(90)  # Half of the previous window still overlaps: 10 * 0.5 = 5 counted
+        assert [limiter.allow("k", rpm=10) for _ in range(5)] == [0.0] * 5
+        assert limiter.allow("k", rpm=10) > 0.0
+
+    def test_long_gap_forgets_history(self, clock):
+        limiter = SlidingWindowLimiter()
+        for _ in range(3):
+            limiter.allow("k", rpm=3)
+        clock.advance(600)
+        assert [limiter.allow("k", rpm=3) for _ in range(3)] == [0.0] * 3
+
+    def test_keys_are_independent(self, clock):
+        limiter = SlidingWindowLimiter()
+        limiter.allow("vertex:m", rpm=1)
+        assert limiter.allow("ai_studio:m", rpm=1) == 0.0
+
+    def test_daily_cap_raises_instead_of_waiting(self, clock):
+        limiter = SlidingWindowLimiter()
+        limiter.allow("k", rpm=100, rpd=2)
+        limiter.allow("k", rpm=100, rpd=2)
+        with pytest.raises(RateLimitExceeded):
+            limiter.allow("k", rpm=100, rpd=2)
+        assert clock.slept == []
+
+    def test_daily_cap_resets_next_day(self, clock):
+        limiter = SlidingWindowLimiter()
+        limiter.allow("k", rpm=100, rpd=1)
+        clock.advance(2 * SlidingWindowLimiter.DAY)
+        assert limiter.allow("k", rpm=100, rpd=1) == 0.0
+
+    def test_unlimited_daily_is_ignored(self, clock):
+        limiter = SlidingWindowLimiter()
+        assert [limiter.allow("k", rpm=1000, rpd="unlimited") for _ in range(50)] == [0.0] * 50
+
+    def test_cap_message_avoids_retry_markers(self, clock):
+        """Quota-retry loops match on these words; a spent daily cap must not spin them."""
+        limiter = SlidingWindowLimiter()
+        limiter.allow("k", rpm=10, rpd=1)
+        with pytest.raises(RateLimitExceeded) as excinfo:
+            limiter.allow("k", rpm=10, rpd=1)
+        message = str(excinfo.value).lower()
+        assert "quota" not in message and "429" not in message
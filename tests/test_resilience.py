@@ -0,0 +1,211 @@
+"""
+Unit tests for the resilience primitives (is_transient, retry_call, CircuitBreaker).
+Runs on a fake clock: nothing here really sleeps.
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from google.genai import errors
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from visions.core import resilience
+from visions.core.resilience import CircuitBreaker, CircuitOpenError, is_quota, is_transient, retry_call, retry_hint
+
+
+@pytest.fixture
+def clocked_module():
+    return resilience
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    # Jitter at its upper bound, so delays are deterministic
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def api_error(code: int, message: str = "boom", status: str = "UNKNOWN") -> errors.APIError:
+    cls = errors.ClientError if code < 500 else errors.ServerError
+    return cls(code, {"error": {"code": code, "message": message, "status": status}})
+
+
+class Flaky:
+    """Raises the queued errors in order, then returns "ok"."""
+
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return "ok"
+
+
+class TestIsTransient:
+    @pytest.mark.parametrize("error", [
+        api_error(429, status="RESOURCE_EXHAUSTED"),
+        api_error(503, status="UNAVAILABLE"),
+        api_error(504),
+        httpx.ReadTimeout("read timed out"),
+        ConnectionResetError(),
+        RuntimeError("DEADLINE_EXCEEDED while waiting"),
+    ])
+    def test_transient(self, error):
+        assert is_transient(error)
+
+    @pytest.mark.parametrize("error", [
+        api_error(400, message="prompt exceeds 1500 tokens", status="INVALID_ARGUMENT"),
+        api_error(404, message="model 429-preview not found", status="NOT_FOUND"),
+        ValueError("expected 500 rows"),
+    ])
+    def test_permanent(self, error):
+        """Digits in the message don't matter; the status code does."""
+        assert not is_transient(error)
+
+
+class TestIsQuota:
+    @pytest.mark.parametrize("error, expected", [
+        (api_error(429, status="RESOURCE_EXHAUSTED"), True),
+        (RuntimeError("Quota exceeded for aiplatform"), True),
+        (api_error(503, status="UNAVAILABLE"), False),
+        (api_error(400, message="quota field is invalid"), False),  # The code decides, not the text
+        (httpx.ReadTimeout("read timed out"), False),
+    ])
+    def test_is_quota(self, error, expected):
+        assert is_quota(error) is expected
+
+
+class TestRetryHint:
+    @pytest.mark.parametrize("message, expected", [
+        ('{"retryDelay": "3s"}', 3.0),
+        ("Please retry in 4.5s.", 4.5),
+        ("Retry-After: 7", 7.0),
+        ("no hint here", None),
+    ])
+    def test_message_hints(self, message, expected):
+        assert retry_hint(RuntimeError(message)) == expected
+
+
+class TestRetryCall:
+    def test_recovers_after_transient_failures(self, clock):
+        func = Flaky(api_error(503), api_error(429))
+        assert retry_call(func, retries=3, base_delay=0.2, max_delay=4.0) == "ok"
+        assert func.calls == 3
+        assert clock.slept == pytest.approx([0.2, 0.4])  # base * 2**attempt
+
+    def test_permanent_error_is_not_retried(self, clock):
+        func = Flaky(api_error(400))
+        with pytest.raises(errors.ClientError):
+            retry_call(func, retries=5)
+        assert func.calls == 1
+        assert clock.slept == []
+
+    def test_last_error_is_raised_when_retries_run_out(self, clock):
+        func = Flaky(*(api_error(503) for _ in range(3)))
+        with pytest.raises(errors.ServerError):
+            retry_call(func, retries=3)
+        assert func.calls == 3
+        assert len(clock.slept) == 2  # No pointless sleep after the final attempt
+
+    def test_delay_is_capped(self, clock):
+        func = Flaky(*(api_error(503) for _ in range(4)))
+        retry_call(func, retries=5, base_delay=1.0, max_delay=2.5)
+        assert clock.slept == pytest.approx([1.0, 2.0, 2.5, 2.5])
+
+    def test_server_hint_replaces_backoff(self, clock):
+        func = Flaky(api_error(429, message="Please retry in 3s.", status="RESOURCE_EXHAUSTED"))
+        retry_call(func, retries=3, base_delay=0.2, max_delay=10.0)
+        assert clock.slept == pytest.approx([3.0])
+
+    def test_server_hint_is_capped(self, clock):
+        func = Flaky(api_error(429, message="Please retry in 90s.", status="RESOURCE_EXHAUSTED"))
+        retry_call(func, retries=3, max_delay=5.0)
+        assert clock.slept == pytest.approx([5.0])
+
+    def test_retry_if_narrows_what_is_retried(self, clock):
+        func = Flaky(api_error(503))
+        with pytest.raises(errors.ServerError):
+            retry_call(func, retries=3, retry_if=is_quota)
+        assert func.calls == 1
+
+    def test_jitter_floor(self, clock, monkeypatch):
+        monkeypatch.setattr(resilience.random, "uniform", lambda low, high: low)
+        func = Flaky(api_error(429), api_error(429))
+        retry_call(func, retries=3, base_delay=2.0, max_delay=100.0, jitter=(0.5, 1.5))
+        assert clock.slept == pytest.approx([1.0, 2.0])  # Never below half the backoff
+
+    def test_max_total_sleep_gives_up_early(self, clock):
+        func = Flaky(*(api_error(503) for _ in range(5)))
+        with pytest.raises(errors.ServerError):
+            retry_call(func, retries=6, base_delay=4.0, max_delay=100.0, max_total_sleep=10.0)
+        assert clock.slept == pytest.approx([4.0])  # 4 + 8 would pass the 10s budget
+        assert func.calls == 2
+
+
+class TestCircuitBreaker:
+    def test_trips_after_threshold_and_short_circuits(self, clock):
+        breaker = CircuitBreaker(fail_threshold=2, reset_timeout=30.0)
+        for _ in range(2):
+            with pytest.raises(errors.ServerError):
+                breaker.call(Flaky(api_error(503)))
+        assert breaker.is_open
+        func = Flaky()
+        with pytest.raises(CircuitOpenError):
+            breaker.call(func)
+        assert func.calls == 0
+
+    def test_permanent_errors_do_not_count(self, clock):
+        breaker = CircuitBreaker(fail_threshold=1, reset_timeout=30.0)
+        with pytest.raises(errors.ClientError):
+            breaker.call(Flaky(api_error(400)))
+        assert not breaker.is_open
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker(fail_threshold=2, reset_timeout=30.0)
+        with pytest.raises(errors.ServerError):
+            breaker.call(Flaky(api_error(503)))
+        assert breaker.call(Flaky()) == "ok"
+        with pytest.raises(errors.ServerError):
+            breaker.call(Flaky(api_error(503)))
+        assert not breaker.is_open
+
+    def test_half_open_probe_success_closes(self, clock):
+        breaker = CircuitBreaker(fail_threshold=1, reset_timeout=30.0)
+        with pytest.raises(errors.ServerError):
+            breaker.call(Flaky(api_error(503)))
+        clock.advance(30.0)
+        assert not breaker.is_open
+        assert breaker.call(Flaky()) == "ok"
+        assert not breaker.is_open
+
+    def test_half_open_probe_failure_reopens(self, clock):
+        breaker = CircuitBreaker(fail_threshold=3, reset_timeout=30.0)
+        for _ in range(3):
+            with pytest.raises(errors.ServerError):
+                breaker.call(Flaky(api_error(503)))
+        clock.advance(30.0)
+        with pytest.raises(errors.ServerError):
+            breaker.call(Flaky(api_error(503)))  # A single failed probe is enough
+        assert breaker.is_open
+
+    def test_failed_probes_back_off_up_to_cap(self, clock):
+        breaker = CircuitBreaker(fail_threshold=1, reset_timeout=10.0, max_reset_timeout=25.0)
+        with pytest.raises(errors.ServerError):
+            breaker.call(Flaky(api_error(503)))
+        timeouts = []
+        for _ in range(3):
+            clock.advance(breaker.reset_timeout)
+            with pytest.raises(errors.ServerError):
+                breaker.call(Flaky(api_error(503)))
+            timeouts.append(breaker.reset_timeout)
+        assert timeouts == [20.0, 25.0, 25.0]
+        clock.advance(breaker.reset_timeout)
+        breaker.call(Flaky())
+        assert breaker.reset_timeout == 10.0  # Success restores the base cooldown
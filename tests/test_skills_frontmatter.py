@@ -0,0 +1,104 @@
+"""
+Unit tests for the PyYAML-free skill frontmatter fast path.
+Whatever `_fast_frontmatter` accepts must parse exactly as `yaml.safe_load` would;
+anything else must be handed back (None) for the full YAML parser.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from visions.core.skills import _fast_frontmatter
+
+SKILLS_DIR = Path(__file__).parent.parent / "visions" / "skills"
+
+
+def _yaml(frontmatter: str):
+    try:
+        return yaml.safe_load(frontmatter) or {}
+    except yaml.YAMLError as e:
+        return e
+
+
+class TestFastPathAccepts:
+    """Flat `key: plain string` frontmatter never needs PyYAML."""
+
+    @pytest.mark.parametrize("frontmatter", [
+        "name: visual\ndescription: Generate and edit images",
+        "name: deep_research\n# comment line\n\ndescription: Multi-step web research (cited)",
+        "usage_trigger: When the user asks for a video, storyboard or shot list",
+        "name: audio\ndescription: Text to speech, renders at 12:30 or later",
+    ])
+    def test_matches_yaml(self, frontmatter):
+        fast = _fast_frontmatter(frontmatter)
+        assert fast is not None
+        assert fast == _yaml(frontmatter)
+
+
+class TestFastPathDefers:
+    """Anything YAML would type, nest or reject goes to the real parser."""
+
+    @pytest.mark.parametrize("frontmatter", [
+        "version: 2",                      # int
+        "version: 1.0",                    # float
+        "date: 2025-01-01",                # date
+        "enabled: true",                   # bool
+        "enabled: Off",                    # YAML 1.1 bool
+        "no: value",                       # bool key
+        "x: ~",                            # null
+        "x: null",                         # null
+        "x: <<",                           # merge tag
+        "<<: value",                       # merge key
+        "x: =",                            # value tag
+        "tags: [a, b]",                    # flow sequence
+        "meta: {a: 1}",                    # flow mapping
+        "x: ]oops",                        # YAML syntax error
+        "x: ,oops",                        # YAML syntax error
+        "description: 'quoted'",           # quoted scalar
+        "description: |",                  # block scalar
+        "x: a: b",                         # nested mapping
+        "x: speech / voice: plain",        # YAML rejects ": " inside a plain value
+        "x: value # trailing comment",     # comment
+        "x: tab\tinside",                  # tab
+        "parent:\n  child: value",         # indentation
+        "- item",                          # sequence
+        "no colon here",                   # not a mapping line
+    ])
+    def test_defers(self, frontmatter):
+        assert _fast_frontmatter(frontmatter) is None
+
+
+def test_random_lines_agree_with_yaml():
+    """Differential check: every accepted random document parses identically under YAML."""
+    rng = random.Random(0)
+    key_chars = string.ascii_letters + "_- <=#:.,'\"[]{}~\t"
+    value_chars = string.ascii_letters + string.digits + " :#-_.,/()!?'\"=<>@`|%&*[]{}~\t+;\\"
+    accepted = 0
+    for _ in range(20000):
+        key = "".join(rng.choice(key_chars) for _ in range(rng.randint(1, 4)))
+        value = "".join(rng.choice(value_chars) for _ in range(rng.randint(0, 8)))
+        frontmatter = f"{key}: {value}\nname: {value[::-1]}"
+        fast = _fast_frontmatter(frontmatter)
+        if fast is None:
+            continue
+        accepted += 1
+        assert fast == _yaml(frontmatter), frontmatter
+    assert accepted > 1000  # The fast path must still take the common case
+
+
+@pytest.mark.parametrize("skill_file", sorted(SKILLS_DIR.glob("*/SKILL.md")), ids=lambda p: p.parent.name)
+def test_shipped_skills_agree_with_yaml(skill_file):
+    text = skill_file.read_text(encoding="utf-8")
+    if not text.startswith("---"):
+        pytest.skip("no YAML frontmatter")
+    frontmatter = text.split("---", 2)[1]
+    fast = _fast_frontmatter(frontmatter)
+    if fast is not None:
+        assert fast == _yaml(frontmatter)
@@ -230,11 +230,12 @@ class VoiceToolExecutor:
                 return f"Knowledge found: {result[:1500]}" if len(str(result)) > 1500 else f"Knowledge found: {result}"
             
             elif function_name == "generate_image":
-                result = self._get_imager().generate_image(args.get("prompt", ""))
-                if result.startswith("IMAGE_GENERATED:"):
+                # Voice only reports success, so skip the base64 wrap entirely
+                image_bytes = self._get_imager().generate_image_bytes(args.get("prompt", ""))
+                if image_bytes:
                     return "Image generated successfully. Describe what you created to the user."
                 else:
-                    return f"Image generation failed: {result}"
+                    return "Image generation failed: no image returned (Safety or Capacity)."
             
             elif function_name == "recommend_camera":
                 result = self._get_camera_advisor().recommend_camera(
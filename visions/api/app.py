@@ -19,7 +19,7 @@ try:
     logger = logging.getLogger("visions-fleet-server")
     print("📡 Cloud Logging Enabled.")
 except Exception:
-    logging.basicConfig(level=logging.INFO)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
     logger = logging.getLogger("visions-fleet-server")
     print("📝 Local Logging Fallback.")
 
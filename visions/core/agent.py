@@ -8,87 +8,482 @@ warnings.filterwarnings("ignore", category=FutureWarning, module="google.cloud.a
 import os
 import time
 import json
-import base64
+import re
+import hashlib
 import logging
+import bisect
 import datetime
+import threading
+import itertools
+import importlib
 import concurrent.futures
-from typing import Optional, Dict, List, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Iterator
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import pybase64 as base64  # SIMD codec, same API; multi-MB image payloads encode/decode several times faster
+    _b64encode_str = base64.b64encode_as_string  # Straight to str: no intermediate bytes copy
+except ImportError:
+    import base64
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 from google import genai
 from google.genai import types
-import vertexai
-from langchain_community.vectorstores import FAISS
-from google.cloud import storage
+# vertexai, FAISS/langchain and google.cloud.storage are imported where used:
+# together they add seconds to cold start and aren't needed to build the agent
 
 # --- Project Imports ---
 from .config import Config
+from .genai_pool import vertex_client
 from .prompts import GOD_MODE
+from .schemas import RoutingDecision
+from .resilience import CircuitBreaker, retry_call
 
 
 logger = logging.getLogger("visions-core")
 
+# Short queries containing none of these skip the triage LLM call entirely
+_TRIAGE_ESCALATION = re.compile(
+    r"\b(why|how|analy\w*|design|prove|compare|debug|explain|review|critique|plan|"
+    r"latest|news|today|current|price|weather|risk|legal|medical|health|money|safe\w*)\b",
+    re.IGNORECASE
+)
+
+# query_fast: questions that must be answered by Pro regardless of speed
+_RISK_SIGNALS = re.compile(r"\b(risk|legal|lawsuit|medical|health|diagnos\w*|dosage|safe\w*|danger\w*|financ\w*|invest\w*)\b", re.IGNORECASE)
+
+# storage.Client per project: one OAuth session, with enough sockets for the parallel sync workers
+_storage_clients: Dict[str, Any] = {}
+_storage_lock = threading.Lock()
+
+
+def _storage_client(project: str):
+    client = _storage_clients.get(project)
+    if client is None:
+        with _storage_lock:
+            client = _storage_clients.get(project)
+            if client is None:
+                import requests
+                from google.cloud import storage
+                client = storage.Client(project=project)
+                # Default pool is 10 connections; download workers beyond that would queue on a socket
+                client._http.mount("https://", requests.adapters.HTTPAdapter(
+                    pool_connections=Config.GCS_SYNC_WORKERS, pool_maxsize=Config.GCS_SYNC_WORKERS))
+                _storage_clients[project] = client
+    return client
+
+# Process-wide cap on in-flight Gemini generations (module-level so agents stay picklable)
+_gemini_sem = threading.BoundedSemaphore(Config.GEMINI_MAX_CONCURRENCY)
+
+
+def _with_slot(func, *args, **kwargs):
+    """Call `func` holding a Gemini slot. Wrap the per-attempt callable so backoff sleeps never hold one."""
+    with _gemini_sem:
+        return func(*args, **kwargs)
+
+
+# Shared outage state: once Vertex is known-down, every query fails fast instead of stampeding
+_gemini_breaker = CircuitBreaker(fail_threshold=5, reset_timeout=30.0, name="gemini")
+# Off-path work (memory persistence). concurrent.futures joins its workers at interpreter exit,
+# so queued saves still run - but by then every executor refuses new work, so tasks here must
+# not submit to another pool
+_bg_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="visions-bg")
+# Tool calls from one model turn (image/speech/video RPCs) fan out here; shared, not built per turn
+_tool_pool = concurrent.futures.ThreadPoolExecutor(max_workers=Config.GEMINI_MAX_CONCURRENCY, thread_name_prefix="visions-tool")
+_pro_warmed_at = float("-inf")  # Last speculative Pro warm-up (monotonic)
+# One loaded FAISS index (+ its embedder) per source/local-copy/embedder, shared by every retriever in the process
+_FAISS_CACHE: Dict[tuple, tuple] = {}  # key -> (FAISS, chunk texts by vector id, loaded_at, marker generation)
+_FAISS_LOCK = threading.Lock()
+_FAISS_REFRESHING: set = set()  # Keys with a background refresh in flight (guarded by _FAISS_LOCK)
+
+# Yielded by VisionsAgent._cascade after a tool-calling turn: query() keeps only the final turn's text
+_TURN_BREAK = object()
+
+# --- Static request config: immutable, so built once instead of per query ---
+
+# Explicit FunctionDeclarations for maximum compatibility with Vertex AI Global Endpoint
+_CREATIVE_TOOLS = [
+    types.FunctionDeclaration(
+        name="generate_image",
+        description="Generate a high-quality cinematic image from a prompt using Gemini 3 Pro Vision.",
+        parameters=types.Schema(
+            type=types.Type.OBJECT,
+            properties={
+                "prompt": types.Schema(type=types.Type.STRING, description="Detailed visual prompt describing the scene.")
+            },
+            required=["prompt"]
+        )
+    ),
+    types.FunctionDeclaration(
+        name="generate_speech",
+        description="Convert text to natural-sounding speech audio.",
+        parameters=types.Schema(
+            type=types.Type.OBJECT,
+            properties={
+                "text": types.Schema(type=types.Type.STRING, description="The exact text to convert to speech."),
+                "voice_name": types.Schema(type=types.Type.STRING, description="Optional voice name (e.g., 'Kore', 'Charon'). Default is 'Kore'.")
+            },
+            required=["text"]
+        )
+    ),
+    types.FunctionDeclaration(
+        name="generate_video",
+        description="Generate a short, high-fidelity video from a text description using Veo.",
+        parameters=types.Schema(
+            type=types.Type.OBJECT,
+            properties={
+                "prompt": types.Schema(type=types.Type.STRING, description="Detailed video prompt describing motion and lighting.")
+            },
+            required=["prompt"]
+        )
+    )
+]
+
+# Tool Configuration - Separate Tool objects per capability
+# CRITICAL: code_execution and function_declarations CANNOT share a Tool object.
+# gemini-3-pro-image-preview does NOT support function calling / code execution;
+# the agentic brain (flash/pro) is the one receiving these tools.
+_CREATIVE_TOOL = types.Tool(function_declarations=_CREATIVE_TOOLS)
+_SEARCH_TOOL = types.Tool(google_search=types.GoogleSearch())
+_GENERATION_TOOLS = [_CREATIVE_TOOL]
+_GROUNDED_GENERATION_TOOLS = [_CREATIVE_TOOL, _SEARCH_TOOL]
+
+_PRO_THINKING = types.ThinkingConfig(include_thoughts=True)
+
+# Robust Safety Settings (Allowing Creative Freedom)
+# Block only explicit high probability harm to allow artistic expression
+_SAFETY_SETTINGS = [
+    types.SafetySetting(category=category, threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH)
+    for category in (
+        types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+        types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+        types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+        types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+    )
+]
+
+_IMAGE_CONFIG = types.GenerateContentConfig(response_modalities=["IMAGE"])
+
+# The persona prompt as a ready Content, so the SDK doesn't re-wrap the str on every request
+_SYSTEM_INSTRUCTION = types.UserContent(parts=[types.Part(text=GOD_MODE)])
+
+# Fast path: one static config shared by every racing call
+_FAST_CONFIG = types.GenerateContentConfig(
+    system_instruction=_SYSTEM_INSTRUCTION,
+    tools=_GENERATION_TOOLS,
+    safety_settings=_SAFETY_SETTINGS,
+    temperature=1.0
+)
+
+@dataclass(frozen=True, slots=True)
+class RoutingResult:
+    """Triage verdict consumed by the heuristic ladder (attribute access, no per-query dict)."""
+    is_high_risk: bool = False
+    complexity: int = 5
+    needs_search: bool = True
+
+    @classmethod
+    def from_json(cls, data: dict) -> "RoutingResult":
+        return cls(
+            is_high_risk=bool(data.get("is_high_risk", False)),
+            complexity=int(data.get("complexity", 5)),
+            needs_search=bool(data.get("needs_search", True))
+        )
+
+
 class KnowledgeRetriever:
     """RAG System with GCS Bucket Synchronization."""
+    SEARCH_CACHE_SIZE = 512
+    SYNC_MANIFEST = ".sync_manifest.json"
+    PUBLISH_MARKER = "_MANIFEST.json"  # Rewritten by build_index.py after every upload
+    GENERATION_KEY = "__marker_generation__"
+
     def __init__(self, project_id: str, location: str = "us-central1"):
         self.project_id = project_id
         self.location = location
         self._db = None
+        self._texts = []  # page_content by FAISS vector id (shared with the process-wide cache)
         self.bucket_name = Config.GCS_BUCKET
         self.gcs_prefix = Config.VECTOR_STORE_PREFIX
         self.local_index = "vector_store"
+        self._search_cache = OrderedDict()  # normalized query -> context (LRU)
+        self._search_lock = threading.Lock()
 
 
-    def _sync_from_gcs(self):
-        """Standard GCS Sink - Ensuring vision is current."""
-        if os.path.exists(self.local_index) and any(os.scandir(self.local_index)):
-            return # Already synced or exists
-            
-        logger.info(f"⬇️ Syncing Knowledge Base from gs://{self.bucket_name}/{self.gcs_prefix}...")
+    def _sync_from_gcs(self) -> Optional[int]:
+        """
+        Standard GCS Sink - Ensuring vision is current (delta sync against a local manifest).
+        Returns the publish-marker generation the local copy now matches (None if unknown or partial).
+        """
+        manifest_path = os.path.join(self.local_index, self.SYNC_MANIFEST)
+        manifest = {}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "rb") as f:
+                    manifest = _json_loads(f.read())
+            except Exception as e:
+                logger.warning("Sync manifest unreadable, resyncing: %s", e)
+        synced_generation = manifest.pop(self.GENERATION_KEY, None)
+
         try:
-            storage_client = storage.Client(project=self.project_id)
-            bucket = storage_client.bucket(self.bucket_name)
-            blobs = bucket.list_blobs(prefix=self.gcs_prefix)
-            
-            os.makedirs(self.local_index, exist_ok=True)
-            for blob in blobs:
-                rel_path = os.path.relpath(blob.name, self.gcs_prefix)
-                dest_path = os.path.join(self.local_index, rel_path)
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                blob.download_to_filename(dest_path)
+            from google.cloud.storage import transfer_manager
+            bucket = _storage_client(self.project_id).bucket(self.bucket_name)
+            prefix = self.gcs_prefix.rstrip("/") + "/"
+            local_files = self._local_files()
+            # One HEAD on the publish marker: unchanged generation means nothing was republished
+            generation = self._marker_generation(bucket, prefix)
+            if generation is not None and generation == synced_generation and local_files.issuperset(manifest):
+                return generation
+
+            # {relative name: [size, md5]} - listing carries both (and only those, via the fields mask)
+            remote = {
+                b.name[len(prefix):]: [b.size, b.md5_hash]
+                for b in bucket.list_blobs(prefix=prefix, fields="items(name,size,md5Hash),nextPageToken")
+                if not b.name.endswith("/") and b.name != prefix + self.PUBLISH_MARKER
+            }
+            blob_names = [
+                name for name, signature in remote.items()
+                if manifest.get(name) != signature or name not in local_files
+            ]
+            if not blob_names:
+                if generation != synced_generation and os.path.isdir(self.local_index):
+                    self._write_manifest(manifest_path, manifest, generation)  # Skip the listing next time
+                return generation  # Local index matches the bucket
+
+            logger.info("⬇️ Syncing %d/%d Knowledge Base files from gs://%s/%s...", len(blob_names), len(remote), self.bucket_name, self.gcs_prefix)
+            # One makedirs per distinct directory, not one per blob inside the download workers
+            for directory in sorted({os.path.dirname(os.path.join(self.local_index, name)) for name in blob_names}):
+                os.makedirs(directory, exist_ok=True)
+            # Unlink before rewriting: a live mmapped index keeps its old inode instead of being truncated under it
+            for name in blob_names:
+                try:
+                    os.remove(os.path.join(self.local_index, name))
+                except FileNotFoundError:
+                    pass
+            # Parallel download: index shards no longer serialize TLS + GCS round-trips
+            results = transfer_manager.download_many_to_path(
+                bucket,
+                blob_names,
+                destination_directory=self.local_index,
+                blob_name_prefix=prefix,
+                max_workers=Config.GCS_SYNC_WORKERS,
+                worker_type=transfer_manager.THREAD,
+                create_directories=False
+            )
+            manifest = {name: sig for name, sig in manifest.items() if name in remote}
+            for name, result in zip(blob_names, results):
+                if isinstance(result, Exception):
+                    logger.error("GCS Sync Failed for %s: %s", name, result)
+                    manifest.pop(name, None)  # Partial download: retry next time
+                    generation = None  # ...which needs the full listing again
+                else:
+                    manifest[name] = remote[name]
+            self._write_manifest(manifest_path, manifest, generation)
+            return generation
         except Exception as e:
-            logger.error(f"GCS Sync Failed: {e}")
+            logger.error("GCS Sync Failed: %s", e)
+            return None
+
+    def _marker_generation(self, bucket=None, prefix: str = None) -> Optional[int]:
+        """Generation of the publish marker (one metadata GET); None if it's missing."""
+        if bucket is None:
+            bucket = _storage_client(self.project_id).bucket(self.bucket_name)
+            prefix = self.gcs_prefix.rstrip("/") + "/"
+        marker = bucket.get_blob(prefix + self.PUBLISH_MARKER)
+        return marker.generation if marker is not None else None
+
+    def _write_manifest(self, manifest_path: str, manifest: dict, generation: Optional[int]):
+        # Atomic rewrite so a crash mid-write never leaves a manifest claiming files we lack
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({**manifest, self.GENERATION_KEY: generation}, f)
+        os.replace(tmp_path, manifest_path)
+
+    def _local_files(self) -> set:
+        """Relative paths already under local_index, from one scandir-backed walk (no per-file stat)."""
+        found = set()
+        for root, _, files in os.walk(self.local_index):
+            rel = os.path.relpath(root, self.local_index).replace(os.sep, "/")
+            found.update(name if rel == "." else f"{rel}/{name}" for name in files)
+        return found
 
     def _load_db(self):
-        if self._db is None:
-            self._sync_from_gcs()
-            from visions.modules.genai.genai_embeddings import GenAIEmbeddings
-            embeddings = GenAIEmbeddings(
-                model_name=Config.EMBEDDING_MODEL,
-                task_type="RETRIEVAL_QUERY",
-                output_dimensionality=Config.EMBEDDING_DIMENSIONS,
-                project=self.project_id,
-                location=self.location
-            )
+        # Everything that makes two loads differ: source, local copy, and the embedder's model/project/region
+        key = (self.bucket_name, self.gcs_prefix, os.path.abspath(self.local_index),
+               Config.EMBEDDING_MODEL, self.project_id, self.location)
+        entry = _FAISS_CACHE.get(key)
+        if entry is None:
+            with _FAISS_LOCK:  # Warmup thread, first queries and sibling agents must not double-load
+                entry = _FAISS_CACHE.get(key)
+                if entry is None:
+                    entry = self._build_entry(key)
+                    if entry is None:
+                        return
+        elif time.time() - entry[2] >= Config.FAISS_CACHE_TTL_SECONDS:
+            self._schedule_refresh(key, entry)  # Stale: keep serving this one while a fresh copy loads
+        if self._db is not entry[0]:
+            self._db, self._texts = entry[0], entry[1]
+            with self._search_lock:
+                self._search_cache.clear()  # Fresh index invalidates memoized hits
+
+    def _build_entry(self, key: tuple) -> Optional[tuple]:
+        """Sync + load + flatten, then publish to the process-wide cache. None if no index could be loaded."""
+        generation = self._sync_from_gcs()
+        db = self._read_index()
+        if db is None:
+            return None
+        # Flatten the docstore once: lookups become a list index, not uuid -> dict -> Document
+        texts = [db.docstore.search(db.index_to_docstore_id[i]).page_content for i in range(db.index.ntotal)]
+        entry = _FAISS_CACHE[key] = (db, texts, time.time(), generation)
+        return entry
 
+    def _schedule_refresh(self, key: tuple, entry: tuple):
+        with _FAISS_LOCK:
+            if key in _FAISS_REFRESHING:
+                return
+            _FAISS_REFRESHING.add(key)
+        threading.Thread(target=self._refresh_entry, args=(key, entry), name="visions-rag-refresh", daemon=True).start()
 
-            if os.path.exists(self.local_index):
+    def _refresh_entry(self, key: tuple, entry: tuple):
+        """
+        TTL refresh off the query path: a republished index is loaded and swapped in.
+        Otherwise (unchanged marker, or a failed reload) the current entry's TTL restarts.
+        """
+        refreshed = False
+        try:
+            try:
+                generation = self._marker_generation()
+            except Exception as e:
+                logger.warning("Publish marker check failed, reloading: %s", e)
+                generation = None
+            if generation is None or generation != entry[3]:
+                refreshed = self._build_entry(key) is not None
+                if refreshed:
+                    logger.info("🔄 FAISS Knowledge Base refreshed.")
+        except Exception as e:
+            logger.error("FAISS Refresh Failed: %s", e)
+        finally:
+            if not refreshed:
+                _FAISS_CACHE[key] = entry[:2] + (time.time(), entry[3])
+            with _FAISS_LOCK:
+                _FAISS_REFRESHING.discard(key)
+
+    def _read_index(self):
+        import faiss
+        from langchain_community.vectorstores import FAISS
+        from visions.modules.genai.genai_embeddings import GenAIEmbeddings
+        embeddings = GenAIEmbeddings(
+            model_name=Config.EMBEDDING_MODEL,
+            task_type="RETRIEVAL_QUERY",
+            output_dimensionality=Config.EMBEDDING_DIMENSIONS,
+            project=self.project_id,
+            location=self.location
+        )
+
+        if not os.path.exists(self.local_index):
+            return None
+        try:
+            # mmap: the page cache backs the vectors, shared across processes on the host
+            db = FAISS.load_local(self.local_index, embeddings, allow_dangerous_deserialization=True,
+                                  io_flags=faiss.IO_FLAG_MMAP)
+            # GPU hosts (faiss-gpu builds only): batched search_many lookups run as one device kernel
+            if hasattr(faiss, "get_num_gpus") and faiss.get_num_gpus() > 0:
                 try:
-                    self._db = FAISS.load_local(self.local_index, embeddings, allow_dangerous_deserialization=True)
-                    logger.info("✅ FAISS Knowledge Base Loaded.")
+                    db.index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, db.index)
+                    logger.info("🎮 FAISS index moved to GPU 0.")
                 except Exception as e:
-                    logger.error(f"FAISS Load Error: {e}")
+                    logger.warning("FAISS GPU transfer failed, staying on CPU: %s", e)
+            if hasattr(db.index, "nprobe"):  # IVF-PQ index from `build_index.py --compact`
+                db.index.nprobe = Config.FAISS_NPROBE
+            logger.info("✅ FAISS Knowledge Base Loaded.")
+            return db
+        except Exception as e:
+            logger.error("FAISS Load Error: %s", e)
+            return None
+
+    def warm_up(self):
+        """Preload the index so the first query doesn't pay GCS sync + FAISS load."""
+        try:
+            self._load_db()
+        except Exception as e:
+            logger.warning("RAG Warmup Failed: %s", e)
+
+    def _lookup(self, vectors: list, k: int = 3) -> List[str]:
+        """Raw FAISS search over query vectors (bypasses LangChain's per-hit Document/metadata copies)."""
+        import numpy as np
+        _, ids = self._db.index.search(np.asarray(vectors, dtype=np.float32), k)
+        return ["\n\n".join([self._texts[j] for j in row if j != -1]) for row in ids]
 
     def search(self, query: str) -> str:
+        words = query.lower().split()
+        if len(words) < Config.RAG_MIN_QUERY_WORDS:
+            return ""
+        key = " ".join(words)
+        with self._search_lock:
+            if key in self._search_cache:
+                self._search_cache.move_to_end(key)
+                return self._search_cache[key]
         try:
             self._load_db()
-            if not self._db: return ""
-            docs = self._db.similarity_search(query, k=3)
-            return "\n\n".join([d.page_content for d in docs])
+            if not self._db or self._db.index.ntotal < Config.RAG_MIN_CORPUS: return ""
+            result = self._lookup([self._db.embedding_function.embed_query(query)])[0]
+            with self._search_lock:
+                self._search_cache[key] = result
+                if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+            return result
         except Exception as e:
-            logger.error(f"RAG Search Error: {e}")
+            logger.error("RAG Search Error: %s", e)
             return ""
 
+    def search_many(self, queries: List[str]) -> List[str]:
+        """
+        Batch form of `search`: cache misses are embedded in one request and looked
+        up with a single FAISS search, instead of one embedding round-trip per query.
+        """
+        results = [None] * len(queries)
+        misses = {}  # normalized key -> positions (duplicate queries are looked up once)
+        with self._search_lock:
+            for i, query in enumerate(queries):
+                words = query.lower().split()
+                key = " ".join(words)
+                if len(words) < Config.RAG_MIN_QUERY_WORDS:
+                    results[i] = ""
+                elif key in self._search_cache:
+                    self._search_cache.move_to_end(key)
+                    results[i] = self._search_cache[key]
+                else:
+                    misses.setdefault(key, []).append(i)
+        if not misses:
+            return results
+        try:
+            self._load_db()
+            if not self._db or self._db.index.ntotal < Config.RAG_MIN_CORPUS:
+                return [r if r is not None else "" for r in results]
+            keys = list(misses)
+            contexts = self._lookup(self._db.embedding_function.embed_queries([queries[misses[k][0]] for k in keys]))
+            with self._search_lock:
+                for key, context in zip(keys, contexts):
+                    for i in misses[key]:
+                        results[i] = context
+                    self._search_cache[key] = context
+                    if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                        self._search_cache.popitem(last=False)
+        except Exception as e:
+            logger.error("RAG Batch Search Error: %s", e)
+        return [r if r is not None else "" for r in results]
+
 class ImageGenerator:
     """Native Image Generation via Gemini 3 Pro Image Preview."""
     MODEL = Config.MODEL_IMAGE
@@ -96,23 +491,37 @@ class ImageGenerator:
     def __init__(self, agent=None):
         self.agent = agent
 
-    def generate_image(self, prompt: str) -> str:
-        client = self.agent._get_client(self.MODEL) if self.agent else genai.Client(vertexai=True, project=Config.VERTEX_PROJECT_ID, location="global")
-        try:
+    @property
+    def client(self) -> genai.Client:
+        """Agent's client when attached, otherwise the shared global client."""
+        if self.agent:
+            return self.agent._get_client(self.MODEL)
+        return vertex_client(Config.VERTEX_PROJECT_ID, "global")
+
+    def generate_image_bytes(self, prompt: str) -> Optional[bytes]:
+        """Raw image bytes for disk/GCS/voice sinks (no base64). None if no image came back; API errors raise."""
+        client = self.client
+        with _gemini_sem:
             response = client.models.generate_content(
                 model=self.MODEL, 
                 contents=prompt,
-                config=types.GenerateContentConfig(response_modalities=["IMAGE"])
+                config=_IMAGE_CONFIG
             )
-            if response.parts:
-                for part in response.parts:
-                    if part.inline_data:
-                        img_bytes = part.inline_data.data
-                        b64_string = base64.b64encode(img_bytes).decode('utf-8')
-                        return f"IMAGE_GENERATED:{b64_string}"
-            return "Error: Image generation failed (Safety or Capacity)."
+        if response.parts:
+            for part in response.parts:
+                if part.inline_data:
+                    return part.inline_data.data
+        return None
+
+    def generate_image(self, prompt: str) -> str:
+        """Web/JSON boundary: base64-wrapped `IMAGE_GENERATED:` tag."""
+        try:
+            img_bytes = self.generate_image_bytes(prompt)
         except Exception as e:
             return f"Error: {e}"
+        if img_bytes is None:
+            return "Error: Image generation failed (Safety or Capacity)."
+        return f"IMAGE_GENERATED:{_b64encode_str(img_bytes)}"
 
 class VisionsAgent:
     """
@@ -120,15 +529,38 @@ class VisionsAgent:
     Heuristic Routing, Multi-Bucket Sync, Deep Thinking, and Advanced Safety.
     """
     
-    MODEL_LOCATIONS = {
+    # Read-only: shared by every agent and consulted on each client fetch
+    MODEL_LOCATIONS = MappingProxyType({
         Config.MODEL_PRO: "global",
         Config.MODEL_FLASH: "global",
         Config.MODEL_IMAGE: "global",
         "gemini-3-pro-image-preview": "global",
         Config.MODEL_IMAGEN_FALLBACK: "us-central1"
-    }
+    })
+    _CLIENT_LOCATIONS = frozenset(MODEL_LOCATIONS.values())
 
     MAX_HISTORY: int = 10
+    # Per-future deadlines for the parallel intel stage (seconds)
+    TRIAGE_TIMEOUT: float = 10.0
+    RAG_TIMEOUT: float = 15.0
+    DEFAULT_ROUTING = RoutingResult()
+    FAST_PATH_ROUTING = RoutingResult(is_high_risk=False, complexity=1, needs_search=False)
+    TRIAGE_FAST_PATH_CHARS: int = 40
+    TRIAGE_CACHE_SIZE: int = 4096
+    IMAGE_CACHE_SIZE: int = 16  # Decoded image parts kept for resent images (MB-sized each)
+
+    # 6-Level Reasoning Heuristic Ladder: tier i applies from complexity _TIER_THRESHOLDS[i-1] upward
+    _TIERS = (
+        (Config.MODEL_FLASH, Config.THINKING_LEVEL_MINIMAL, "Tier 1: Flash / Minimal"),
+        (Config.MODEL_FLASH, Config.THINKING_LEVEL_LOW, "Tier 2: Flash / Low"),
+        (Config.MODEL_FLASH, Config.THINKING_LEVEL_MEDIUM, "Tier 3: Flash / Medium"),
+        (Config.MODEL_FLASH, Config.THINKING_LEVEL_HIGH, "Tier 4: Flash / High"),
+        (Config.MODEL_PRO, Config.THINKING_LEVEL_LOW, "Tier 5: Pro / Low"),
+        (Config.MODEL_PRO, Config.THINKING_LEVEL_HIGH, "Tier 6: Pro / High (God Mode)"),
+    )
+    _TIER_THRESHOLDS = (2, 4, 6, 7, 9)
+    PRO_WARM_BAND = (5, 6)  # Flash-routed complexities one step below Pro: keep Pro hot speculatively
+    PRO_WARM_INTERVAL: float = 60.0  # At most one speculative Pro warm-up per interval
 
     def __init__(self, project: str = Config.VERTEX_PROJECT_ID, location: str = Config.VERTEX_LOCATION):
         self.project = project
@@ -137,7 +569,6 @@ class VisionsAgent:
         Config.VERTEX_PROJECT_ID = project
         Config.VERTEX_LOCATION = location
         
-        self._clients = {}
         self._tools_initialized = False
 
 
@@ -157,42 +588,40 @@ class VisionsAgent:
         logger.info("⚙️ Initializing Visions Agent Resources...")
         
         # Init GCP
+        import vertexai
         vertexai.init(project=self.project, location=self.location)
+        # Every location's client resolved up front (from the shared pool): _get_client is one dict hit.
+        # Clients are not picklable, so this is set here, never in __init__.
+        self._clients = {loc: vertex_client(self.project, loc) for loc in self._CLIENT_LOCATIONS}
         
         # Lazy imports for stability and pickling
         from .skills import SkillRegistry
         from visions.modules.mem_store.memory_cloud import CloudMemoryManager
-        from visions.modules.genai.genai_embeddings import GenAIEmbeddings
-        from tools.vision_tools import VisionTools
-        from tools.youtube_tools import YouTubeTools
-        from tools.cinema_tools import CinemaTools
-        from tools.agent_connect import AgentConnector
-        from tools.browser_tool import BrowserTool
-        from tools.audio_tools import AudioGenerator
-        from tools.video_tools import VeoDirector
 
 
         # Systems
         self.retriever = KnowledgeRetriever(project_id=self.project, location=self.location)
+        # Warm the index (GCS sync + FAISS load) off the first-query path
+        self._warmup = threading.Thread(target=self.retriever.warm_up, name="visions-rag-warmup", daemon=True)
+        self._warmup.start()
         self.imager = ImageGenerator(agent=self)
 
-        self.skill_registry = SkillRegistry()
+        self.skill_registry = SkillRegistry.instance()  # Scans on first use
         self.memory = CloudMemoryManager(project_id=self.project)
         
-        # Tools
-        self.vision_tools = VisionTools(project_id=self.project, location="global")
-        self.youtube_tools = YouTubeTools(project_id=self.project, location=self.location)
-        self.cinema_tools = CinemaTools()
-        self.agent_connector = AgentConnector()
-        try:
-            self.browser_tool = BrowserTool()
-        except Exception as e:
-            logger.warning(f"⚠️ BrowserTool init failed (npx missing?): {e}")
-            self.browser_tool = None
-
-        self.audio_generator = AudioGenerator(project=self.project, location=self.location)
-        self.video_director = VeoDirector(project=self.project, location=self.location)
+        # Tools are built on first access (see _TOOL_FACTORIES / __getattr__)
+        self._tools_lock = threading.Lock()
 
+        # Context pool: triage + RAG run side by side (created here, executors are not picklable)
+        self._ctx_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="visions-ctx")
+        self._image_parts = OrderedDict()  # blake2b(image_base64) -> types.Part (LRU)
+        self._image_lock = threading.Lock()
+        self._triage_cache = OrderedDict()  # blake2b(normalized question) -> RoutingResult (LRU)
+        self._triage_lock = threading.Lock()
+        # Open TLS (and HTTP/2) sessions before the first user query needs them
+        # One handshake per location, side by side (TLS + OAuth token before the first query)
+        for loc, client in self._clients.items():
+            _bg_pool.submit(self._prewarm_client, loc, client)
         
         self._tools_initialized = True
         logger.info("✅ Visions Agent Resources Initialized.")
@@ -202,15 +631,105 @@ class VisionsAgent:
         if not self._tools_initialized:
             self.set_up()
 
+    # --- Lazy Tools: a turn only pays for the tools it actually touches ---
+    # attribute -> (module, class, constructor kwargs, optional). Built on first access by __getattr__;
+    # an optional tool that fails to build (BrowserTool without npx) resolves to None instead of raising.
+    _TOOL_FACTORIES = MappingProxyType({
+        "vision_tools": ("tools.vision_tools", "VisionTools", lambda a: {"project_id": a.project, "location": "global"}, False),
+        "youtube_tools": ("tools.youtube_tools", "YouTubeTools", lambda a: {"project_id": a.project, "location": a.location}, False),
+        "cinema_tools": ("tools.cinema_tools", "CinemaTools", lambda a: {}, False),
+        "agent_connector": ("tools.agent_connect", "AgentConnector", lambda a: {}, False),
+        "browser_tool": ("tools.browser_tool", "BrowserTool", lambda a: {}, True),
+        "audio_generator": ("tools.audio_tools", "AudioGenerator", lambda a: {"project": a.project, "location": a.location}, False),
+        "video_director": ("tools.video_tools", "VeoDirector", lambda a: {"project": a.project, "location": a.location}, False),
+    })
+
+    def __getattr__(self, name: str):
+        # Only reached when normal lookup misses; resolve against the class so half-built
+        # instances (e.g. mid-unpickle) never recurse into instance state
+        spec = type(self)._TOOL_FACTORIES.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self._ensure_initialized()
+        with self._tools_lock:
+            if name not in self.__dict__:
+                module, cls_name, kwargs, optional = spec
+                try:
+                    tool = getattr(importlib.import_module(module), cls_name)(**kwargs(self))
+                except Exception as e:
+                    if not optional:
+                        raise
+                    logger.warning("⚠️ %s init failed (npx missing?): %s", cls_name, e)
+                    tool = None
+                self.__dict__[name] = tool  # Cached: later lookups never reach __getattr__
+        return self.__dict__[name]
+
     def _get_client(self, model: str = None) -> genai.Client:
         self._ensure_initialized()
-        loc = self.MODEL_LOCATIONS.get(model, "global")
-        # Clients are not picklable, so we don't store them in __init__
-        # But we can cache them in the instance once running
-        if loc not in self._clients:
-            self._clients[loc] = genai.Client(vertexai=True, project=self.project, location=loc)
-        return self._clients[loc]
+        return self._clients[self.MODEL_LOCATIONS.get(model, "global")]
+
+    def _warm_pro(self):
+        """Throttled, fire-and-forget Pro ping so the next Pro-tier query doesn't hit a cold path."""
+        global _pro_warmed_at
+        now = time.monotonic()
+        if now - _pro_warmed_at < self.PRO_WARM_INTERVAL:
+            return
+        _pro_warmed_at = now
+        client = self._get_client(Config.MODEL_PRO)
+
+        def ping():
+            try:
+                client.models.count_tokens(model=Config.MODEL_PRO, contents="hi")
+            except Exception as e:
+                logger.debug("Pro warm-up: %s", e)
+        _bg_pool.submit(ping)
+
+    @staticmethod
+    def _prewarm_client(loc: str, client: genai.Client):
+        try:
+            client.models.count_tokens(model=Config.MODEL_FLASH, contents="ping")
+        except Exception as e:
+            # Any response (even a 4xx) has already paid the handshake
+            logger.debug("Client prewarm (%s): %s", loc, e)
+
 
+    def _image_part(self, image_base64: str) -> types.Part:
+        """Decode an inbound image once; a resent image (same session, retries) reuses its Part."""
+        key = hashlib.blake2b(image_base64.encode("ascii"), digest_size=16).digest()
+        with self._image_lock:
+            part = self._image_parts.get(key)
+            if part is not None:
+                self._image_parts.move_to_end(key)
+                return part
+        part = types.Part.from_bytes(data=base64.b64decode(image_base64), mime_type="image/png")
+        with self._image_lock:
+            self._image_parts[key] = part
+            if len(self._image_parts) > self.IMAGE_CACHE_SIZE:
+                self._image_parts.popitem(last=False)
+        return part
+
+    def _open_stream(self, client: genai.Client, **kwargs) -> Iterator[types.GenerateContentResponse]:
+        """
+        Open a generation stream behind backoff + circuit breaker.
+        The first chunk is pulled eagerly: that's where connection/quota errors surface,
+        and it's the last point a retry is safe (nothing has been yielded yet).
+        Each attempt takes its own Gemini slot, released before any backoff sleep.
+        """
+        def attempt():
+            stream = iter(client.models.generate_content_stream(**kwargs))
+            first = next(stream, None)
+            return itertools.chain([first] if first is not None else [], stream)
+        return _gemini_breaker.call(lambda: retry_call(lambda: _with_slot(attempt)))
+
+    @staticmethod
+    def _pull_chunks(stream: Iterator[types.GenerateContentResponse]) -> Iterator[types.GenerateContentResponse]:
+        """Re-yield `stream`, taking a Gemini slot for each pull and releasing it before handing the chunk on."""
+        while True:
+            with _gemini_sem:
+                chunk = next(stream, None)
+            if chunk is None:
+                return
+            yield chunk
 
     def count_tokens(self, content: Any, model: str = Config.MODEL_FLASH) -> int:
         """Count tokens for usage optimization."""
@@ -220,143 +739,113 @@ class VisionsAgent:
             response = client.models.count_tokens(model=model, contents=content)
             return response.total_tokens
         except Exception as e:
-            logger.error(f"Token count failed: {e}")
+            logger.error("Token count failed: %s", e)
             return 0
 
-    def _triage_query(self, question: str) -> dict:
-        """Route query by complexity/risk."""
+    def _triage_query(self, question: str) -> RoutingResult:
+        """Route query by complexity/risk (heuristic fast path, then LRU, then Flash)."""
+        if self._is_trivial(question):
+            return self.FAST_PATH_ROUTING  # Trivial chatter: Tier 1 without an LLM round-trip
+
+        # Fixed 16-byte key: 4096 entries stay small however long the questions are
+        key = hashlib.blake2b(" ".join(question.lower().split()).encode("utf-8"), digest_size=16).digest()
+        with self._triage_lock:
+            cached = self._triage_cache.get(key)
+            if cached is not None:
+                self._triage_cache.move_to_end(key)
+                return cached
+
         try:
             client = self._get_client(Config.MODEL_FLASH)
-            prompt = f"Categorize query. Respond JSON: {{'is_high_risk': bool, 'complexity': 1-10, 'needs_search': bool}}. Query: {question}"
-            response = client.models.generate_content(
+            prompt = f"Categorize query by risk, complexity (1-10) and whether it needs live search. Query: {question}"
+            response = _gemini_breaker.call(lambda: retry_call(lambda: _with_slot(
+                client.models.generate_content,
                 model=Config.MODEL_FLASH,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json",
+                    response_schema=RoutingDecision,
                     temperature=0.0 # Deterministic routing
                 )
-            )
-            return json.loads(response.text)
+            )))
+            routing = RoutingResult.from_json(_json_loads(response.text))
         except Exception:
-            return {"is_high_risk": False, "complexity": 5, "needs_search": True}
+            return self.DEFAULT_ROUTING  # Not cached: the next attempt may reach Flash
+
+        with self._triage_lock:
+            self._triage_cache[key] = routing
+            if len(self._triage_cache) > self.TRIAGE_CACHE_SIZE:
+                self._triage_cache.popitem(last=False)
+        return routing
+
+    def _is_trivial(self, question: str) -> bool:
+        return len(question) < self.TRIAGE_FAST_PATH_CHARS and not _TRIAGE_ESCALATION.search(question)
 
-    def query(self, question: str, image_base64: str = None, user_id: str = "user", config: dict = None) -> str:
-        """Standard Rhea Noir Cascade with God Mode Enhancements."""
-        routing = self._triage_query(question)
-        complexity = int(routing.get("complexity", 5))
-        is_high_risk = routing.get("is_high_risk", False)
+    def query(self, question: str, image_base64: str = None, user_id: str = "user", config: dict = None,
+              image_bytes: bytes = None) -> str:
+        """Standard Rhea Noir Cascade with God Mode Enhancements. Returns the final turn's text (what memory stores)."""
+        parts = []
+        for piece in self._cascade(question, image_base64, user_id, image_bytes):
+            if piece is _TURN_BREAK:
+                parts.clear()  # Text before a tool call belongs to an intermediate turn
+            else:
+                parts.append(piece)
+        return "".join(parts)
+
+    def query_stream(self, question: str, image_base64: str = None, user_id: str = "user", config: dict = None,
+                     image_bytes: bytes = None) -> Iterator[str]:
+        """
+        Streaming Rhea Noir Cascade: yields response text as the synthesis model produces it,
+        including any text the model emits before a tool call.
+        In-process callers holding raw image bytes pass `image_bytes`; base64 is only for remote/JSON callers.
+        """
+        for piece in self._cascade(question, image_base64, user_id, image_bytes):
+            if piece is not _TURN_BREAK:
+                yield piece
+
+    def _cascade(self, question: str, image_base64: Optional[str], user_id: str,
+                 image_bytes: Optional[bytes]) -> Iterator[Any]:
+        """Shared body of query/query_stream: text chunks, with _TURN_BREAK after each tool-calling turn."""
+        self._ensure_initialized()
+
+        # Trivial chatter: Tier 1 with neither a triage call nor a RAG lookup
+        if self._is_trivial(question):
+            routing = self.FAST_PATH_ROUTING
+            knowledge_future = None
+        else:
+            # Parallel Intel: triage and RAG are independent, so neither waits on the other
+            triage_future = self._ctx_executor.submit(self._triage_query, question)
+            knowledge_future = self._ctx_executor.submit(self.retriever.search, question)
+            try:
+                routing = triage_future.result(timeout=self.TRIAGE_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                logger.warning("⚠️ Triage exceeded %ss. Using default routing.", self.TRIAGE_TIMEOUT)
+                routing = self.DEFAULT_ROUTING
+        complexity = routing.complexity
+        is_high_risk = routing.is_high_risk
         
         # 6-Level Reasoning Heuristic Ladder
-        logger.info(f"🤔 Smart Router Analysis - Complexity: {complexity}, Risk: {is_high_risk}")
-
-        if is_high_risk or complexity >= 9:
-            target_model = Config.MODEL_PRO
-            thinking_level = Config.THINKING_LEVEL_HIGH
-            routing_tier = "Tier 6: Pro / High (God Mode)"
-        elif complexity >= 7:
-            target_model = Config.MODEL_PRO
-            thinking_level = Config.THINKING_LEVEL_LOW
-            routing_tier = "Tier 5: Pro / Low"
-        elif complexity >= 6:
-            target_model = Config.MODEL_FLASH
-            thinking_level = Config.THINKING_LEVEL_HIGH
-            routing_tier = "Tier 4: Flash / High"
-        elif complexity >= 4:
-            target_model = Config.MODEL_FLASH
-            thinking_level = Config.THINKING_LEVEL_MEDIUM
-            routing_tier = "Tier 3: Flash / Medium"
-        elif complexity >= 2:
-            target_model = Config.MODEL_FLASH
-            thinking_level = Config.THINKING_LEVEL_LOW
-            routing_tier = "Tier 2: Flash / Low"
-        else:
-            target_model = Config.MODEL_FLASH
-            thinking_level = Config.THINKING_LEVEL_MINIMAL
-            routing_tier = "Tier 1: Flash / Minimal"
+        logger.info("🤔 Smart Router Analysis - Complexity: %s, Risk: %s", complexity, is_high_risk)
+
+        tier = len(self._TIERS) - 1 if is_high_risk else bisect.bisect_right(self._TIER_THRESHOLDS, complexity)
+        target_model, thinking_level, routing_tier = self._TIERS[tier]
+        if target_model != Config.MODEL_PRO and self.PRO_WARM_BAND[0] <= complexity <= self.PRO_WARM_BAND[1]:
+            self._warm_pro()
             
-        logger.info(f"➡️ Routing Decision: {routing_tier}")
+        logger.info("➡️ Routing Decision: %s", routing_tier)
         
-        # Parallel Intel
-        context = ""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            futures = []
-            if routing.get("needs_search"):
-                futures.append(executor.submit(self._get_client(Config.MODEL_FLASH).models.generate_content, 
-                                               model=Config.MODEL_FLASH, 
-                                               contents=f"Grounding search for: {question}",
-                                               config=types.GenerateContentConfig(tools=[types.Tool(google_search=types.GoogleSearch())])))
-            futures.append(executor.submit(self.retriever.search, question))
-            
-            for f in concurrent.futures.as_completed(futures):
-                try:
-                    res = f.result()
-                    if hasattr(res, 'text'): context += f"\nSearch: {res.text}"
-                    elif isinstance(res, str): context += f"\nKnowledge: {res}"
-                except Exception: pass
-
-        # 6. Context Clipping (Token Optimization)
-        if len(context) > 150000:
-            logger.warning(f"⚠️ Context exceeds safety threshold. Clipping for token optimization...")
-            context = context[:150000] + "... [Context Truncated]"
-
-        # Multimodal synthesis
-        contents = [f"Intelligence Context: {context}\n\nInquiry: {question}"]
-        if image_base64:
-            contents.append(types.Part.from_bytes(data=base64.b64decode(image_base64), mime_type="image/png"))
+        # Knowledge Intel (Search grounding now rides on the synthesis call itself)
+        contents = self._build_contents(question, self._await_knowledge(knowledge_future), image_base64, image_bytes)
 
-        # Pre-flight Token Check
-        token_count = self.count_tokens(contents, model=target_model)
-        logger.info(f"🪙 Estimated Tokens: {token_count}")
+        # Local token estimate (the count_tokens API would cost another serial round-trip)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🪙 Estimated Tokens: %d", self._estimate_tokens(contents))
 
         # Execute Synthesis with Tool Support
         client = self._get_client(target_model)
         
-        # Define Tool Definitions for Multimodal Generation
-        # We use explicit FunctionDeclarations for maximum compatibility with Vertex AI Global Endpoint
-        creative_tools = [
-            types.FunctionDeclaration(
-                name="generate_image",
-                description="Generate a high-quality cinematic image from a prompt using Gemini 3 Pro Vision.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "prompt": types.Schema(type=types.Type.STRING, description="Detailed visual prompt describing the scene.")
-                    },
-                    required=["prompt"]
-                )
-            ),
-            types.FunctionDeclaration(
-                name="generate_speech",
-                description="Convert text to natural-sounding speech audio.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "text": types.Schema(type=types.Type.STRING, description="The exact text to convert to speech."),
-                        "voice_name": types.Schema(type=types.Type.STRING, description="Optional voice name (e.g., 'Kore', 'Charon'). Default is 'Kore'.")
-                    },
-                    required=["text"]
-                )
-            ),
-            types.FunctionDeclaration(
-                name="generate_video",
-                description="Generate a short, high-fidelity video from a text description using Veo.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "prompt": types.Schema(type=types.Type.STRING, description="Detailed video prompt describing motion and lighting.")
-                    },
-                    required=["prompt"]
-                )
-            )
-        ]
-
-        # Tool Configuration - Separate Tool objects per capability
-        # CRITICAL: code_execution and function_declarations CANNOT share a Tool object.
-        # gemini-3-pro-image-preview does NOT support function calling / code execution;
-        # the agentic brain (flash/pro) is the one receiving these tools.
-        generation_tools = [
-             types.Tool(function_declarations=creative_tools),
-        ]
+        # Grounding in-call when triage asks for it: saves the serial Flash "grounding search" round-trip
+        generation_tools = _GROUNDED_GENERATION_TOOLS if routing.needs_search else _GENERATION_TOOLS
 
         # Tool Mapping for dispatch
         tool_dispatch = {
@@ -365,123 +854,226 @@ class VisionsAgent:
             "generate_video": self.generate_video
         }
 
-        # Robust Safety Settings (Allowing Creative Freedom)
-        # Block only explicit high probability harm to allow artistic expression
-        safety_settings = [
-            types.SafetySetting(category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH, threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH),
-            types.SafetySetting(category=types.HarmCategory.HARM_CATEGORY_HARASSMENT, threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH),
-            types.SafetySetting(category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT, threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH),
-            types.SafetySetting(category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT, threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH),
-        ]
-
         # Multi-turn Tool Loop (Token Optimized TST-Loop)
         chat_contents = list(contents)  # Preserve original contents
         max_tool_turns = 3
         payload_store = {} # Side-channel to prevent token explosion
         final_response = None
         
+        # Same model, tools and thinking for every turn: build the request config once
+        synthesis_config = types.GenerateContentConfig(
+            system_instruction=_SYSTEM_INSTRUCTION,
+            tools=generation_tools,
+            thinking_config=_PRO_THINKING if target_model == Config.MODEL_PRO else None,  # Apply Thinking Config (Pro only)
+            safety_settings=_SAFETY_SETTINGS,
+            temperature=1.0
+        )
+
         try:
             for turn in range(max_tool_turns):
-                # Apply Thinking Config (Pro only)
-                thinking_cfg = None
-                if target_model == Config.MODEL_PRO:
-                    thinking_cfg = types.ThinkingConfig(include_thoughts=True)
-
-                logger.info(f"🚀 Turn {turn+1} | Model: {target_model}")
+                logger.info("🚀 Turn %d | Model: %s", turn + 1, target_model)
                 
-                response = client.models.generate_content(
+                # Parse streamed parts for tool calls and text. Text goes out as soon as it lands,
+                # unless side-channel payloads must be spliced in first (IDs may straddle chunks).
+                # The concurrency slot is held only while opening the stream or pulling a chunk:
+                # never across a yield (a slow consumer), a retry backoff or tool dispatch.
+                tool_calls = []
+                text_parts = []
+                model_parts = []
+                usage = None
+                stream = self._open_stream(
+                    client,
                     model=target_model,
                     contents=chat_contents,
-                    config=types.GenerateContentConfig(
-                        system_instruction=GOD_MODE,
-                        tools=generation_tools,
-                        thinking_config=thinking_cfg,
-                        safety_settings=safety_settings,
-                        temperature=1.0 
-                    )
+                    config=synthesis_config
                 )
-                
-                # Parse response parts for tool calls and text
-                tool_calls = []
-                text_parts = []
-                if response.candidates and response.candidates[0].content.parts:
-                    for part in response.candidates[0].content.parts:
+                for chunk in self._pull_chunks(stream):
+                    if chunk.usage_metadata:
+                        usage = chunk.usage_metadata  # Cumulative; the last chunk carries the totals
+                    if not (chunk.candidates and chunk.candidates[0].content and chunk.candidates[0].content.parts):
+                        continue
+                    for part in chunk.candidates[0].content.parts:
+                        model_parts.append(part)
                         if part.function_call:
                             tool_calls.append(part.function_call)
-                        elif part.text:
+                        elif part.text and not part.thought:
                             text_parts.append(part.text)
-                
+                            if not payload_store:
+                                yield part.text
+                if usage:
+                    logger.info("🪙 Turn %d Tokens: %s in / %s out / %s total", turn + 1,
+                                usage.prompt_token_count, usage.candidates_token_count, usage.total_token_count)
+
                 if not tool_calls:
                     # No tools invoked — final text response
-                    final_response = response.text or "\n".join(text_parts)
+                    final_response = "".join(text_parts)
                     break
-                
+
                 # --- Append model's own response (with function_call parts) to history ---
                 # This is required so the model sees: user → model(function_call) → user(function_response)
-                chat_contents.append(response.candidates[0].content)
+                chat_contents.append(types.Content(parts=model_parts, role="model"))
                 
-                # Execute calls with Token-Safe Interception (TST)
+                # Execute calls with Token-Safe Interception (TST).
+                # Image/speech/video are independent multi-second RPCs: several calls in one turn run side by side.
+                if len(tool_calls) > 1:
+                    outcomes = list(_tool_pool.map(lambda tc: self._run_tool(tool_dispatch, tc), tool_calls))
+                else:
+                    outcomes = [self._run_tool(tool_dispatch, tool_calls[0])]
+
                 tool_result_parts = []
-                for tc in tool_calls:
-                    if tc.name in tool_dispatch:
-                        try:
-                            args = {k: v for k, v in tc.args.items()}
-                            result = tool_dispatch[tc.name](**args)
-                            
-                            # Token Optimization: Intercept massive results (base64)
-                            if isinstance(result, str) and len(result) > 5000:
-                                payload_id = f"PL_{int(time.time())}_{tc.name}"
-                                payload_store[payload_id] = result
-                                placeholder = f"SUCCESS. Payload stored as {payload_id}. Reference this ID in your response to the user."
-                                logger.info(f"📥 Massive payload stored in side-channel: {payload_id}")
-                                model_result = placeholder
-                            else:
-                                model_result = result
-                                
-                            tool_result_parts.append(
-                                types.Part.from_function_response(
-                                    name=tc.name,
-                                    response={"result": model_result}
-                                )
-                            )
-                        except Exception as tool_e:
-                            logger.error(f"Tool {tc.name} error: {tool_e}")
-                            tool_result_parts.append(
-                                types.Part.from_function_response(
-                                    name=tc.name,
-                                    response={"error": str(tool_e)}
-                                )
-                            )
+                for tc, (result, error) in zip(tool_calls, outcomes):
+                    if error is not None:
+                        response = {"error": error}
+                    # Token Optimization: Intercept massive results (base64)
+                    elif isinstance(result, str) and len(result) > 5000:
+                        payload_id = f"PL_{int(time.time())}_{tc.name}_{len(payload_store)}"  # Unique per call
+                        payload_store[payload_id] = result
+                        logger.info("📥 Massive payload stored in side-channel: %s", payload_id)
+                        response = {"result": f"SUCCESS. Payload stored as {payload_id}. Reference this ID in your response to the user."}
                     else:
-                        tool_result_parts.append(
-                            types.Part.from_function_response(
-                                name=tc.name,
-                                response={"error": f"Tool '{tc.name}' not available."}
-                            )
-                        )
+                        response = {"result": result}
+                    tool_result_parts.append(types.Part.from_function_response(name=tc.name, response=response))
                 
                 # Append tool results as user turn
                 chat_contents.append(types.Content(parts=tool_result_parts, role="user"))
+                yield _TURN_BREAK
                 
             else:
                 # for/else: loop exhausted without break
                 if final_response is None:
                     final_response = "Tool loop exceeded max turns. Please simplify your request."
+                    if not payload_store:
+                        yield final_response
 
-            # 8. Post-Processing: Restore Payloads to Final Response
-            for p_id, p_content in payload_store.items():
-                final_response = final_response.replace(p_id, p_content)
+            # 8. Post-Processing: Restore Payloads to Final Response (held back from the stream)
+            if payload_store:
+                final_response = self._restore_payloads(final_response, payload_store)
+                yield final_response
 
             # 6. Persistent Memory (Fire-and-forget for speed)
-            try:
-                self.memory.save_interaction(user_id=user_id, prompt=question, response=final_response)
-            except Exception as mem_e:
-                logger.warning(f"Memory Save Failure: {mem_e}")
-                
-            return final_response
+            _bg_pool.submit(self._safe_mem_save, user_id, question, final_response)
+        except Exception as e:
+            logger.error("Synthesis Loop Error: %s", e)
+            yield _TURN_BREAK  # query() returns just the error, as before streaming
+            yield f"Service interruption in synthesis: {e}"
+
+    @staticmethod
+    def _run_tool(tool_dispatch: Dict[str, Any], tc: types.FunctionCall) -> tuple:
+        """Dispatch one function call. Returns (result, None), or (None, error message)."""
+        if tc.name not in tool_dispatch:
+            return None, f"Tool '{tc.name}' not available."
+        try:
+            return tool_dispatch[tc.name](**(tc.args or {})), None  # FunctionCall.args is already a plain dict
+        except Exception as tool_e:
+            logger.error("Tool %s error: %s", tc.name, tool_e)
+            return None, str(tool_e)
+
+    @staticmethod
+    def _restore_payloads(text: str, payload_store: Dict[str, str]) -> str:
+        """Splice side-channel payloads back in with one pass over the (possibly multi-MB) response."""
+        if len(payload_store) == 1:
+            (p_id, p_content), = payload_store.items()
+            return text.replace(p_id, p_content)
+        # Longest IDs first so an ID that prefixes another (PL_..._1 vs PL_..._10) never wins early
+        pattern = re.compile("|".join(re.escape(p_id) for p_id in sorted(payload_store, key=len, reverse=True)))
+        return pattern.sub(lambda m: payload_store[m.group(0)], text)
+
+    def _safe_mem_save(self, user_id: str, question: str, response: str):
+        try:
+            # Already on _bg_pool: write GCS/BigQuery here rather than through the manager's own pool
+            self.memory.save_interaction(user_id=user_id, prompt=question, response=response, fan_out=False)
+        except Exception as mem_e:
+            logger.warning("Memory Save Failure: %s", mem_e)
+
+    def _await_knowledge(self, knowledge_future: Optional[concurrent.futures.Future]) -> str:
+        if knowledge_future is None:
+            return ""
+        try:
+            return knowledge_future.result(timeout=self.RAG_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            logger.warning("⚠️ RAG exceeded %ss. Proceeding without knowledge context.", self.RAG_TIMEOUT)
+        except Exception:
+            pass
+        return ""
+
+    def _build_contents(self, question: str, knowledge: str, image_base64: str = None, image_bytes: bytes = None) -> list:
+        """Assemble the synthesis prompt (+ optional image) from gathered intel."""
+        context = ""
+        if knowledge:
+            context += f"\nKnowledge: {knowledge}"
+
+        # 6. Context Clipping (Token Optimization)
+        context = self._compress_context(context)
+
+        # Multimodal synthesis
+        contents = [f"Intelligence Context: {context}\n\nInquiry: {question}"]
+        if image_bytes:
+            contents.append(types.Part.from_bytes(data=image_bytes, mime_type="image/png"))
+        elif image_base64:
+            contents.append(self._image_part(image_base64))
+        return contents
+
+    @staticmethod
+    def _text_tokens(text: str) -> int:
+        """Local token estimate: ~4 ASCII chars/token; CJK and other non-ASCII text runs ~1 token/char."""
+        ascii_chars = len(text.encode("ascii", "ignore"))
+        return ascii_chars // 4 + (len(text) - ascii_chars)
+
+    @classmethod
+    def _compress_context(cls, context: str, budget: int = Config.RAG_CONTEXT_TOKEN_BUDGET) -> str:
+        """Fit context to a token budget, keeping head and tail and dropping the middle."""
+        tokens = cls._text_tokens(context)
+        if tokens <= budget:
+            return context
+        logger.warning("⚠️ Context ~%d tokens exceeds budget %d. Clipping for token optimization...", tokens, budget)
+        marker = "\n... [Context Truncated] ...\n"
+        # Scale by this context's own chars-per-token so dense (non-ASCII) text is clipped harder
+        keep = max(0, int(budget * len(context) / tokens) - len(marker))
+        head = keep * 2 // 3  # Best-ranked chunks lead, so bias toward the head
+        return context[:head] + marker + context[len(context) - (keep - head):]
+
+    @classmethod
+    def _estimate_tokens(cls, contents: list) -> int:
+        """Local text estimate, flat 258 tokens per image part (Gemini's per-image rate)."""
+        return sum(cls._text_tokens(c) if isinstance(c, str) else 258 for c in contents)
+
+    def query_fast(self, question: str, image_base64: str = None, user_id: str = "user", image_bytes: bytes = None) -> str:
+        """
+        Triage-free fast path: no routing round-trip before synthesis.
+        Risky questions go straight to Pro, everything else to Flash: one generation, never a
+        speculative one whose answer would be discarded. Defers to the full cascade whenever
+        the model asks for a tool or the call fails.
+        """
+        self._ensure_initialized()
+        knowledge_future = None if self._is_trivial(question) else self._ctx_executor.submit(self.retriever.search, question)
+        contents = self._build_contents(question, self._await_knowledge(knowledge_future), image_base64, image_bytes)
+
+        model = Config.MODEL_PRO if _RISK_SIGNALS.search(question) else Config.MODEL_FLASH
+        logger.info("⚡ Fast Path - Model: %s", model)
+
+        final_response = None
+        try:
+            response = self._fast_generate(model, contents)
+            if response.function_calls:
+                logger.info("🛠️ Fast path requested tools. Deferring to full cascade.")
+            else:
+                final_response = response.text or None
         except Exception as e:
-            logger.error(f"Synthesis Loop Error: {e}")
-            return f"Service interruption in synthesis: {e}"
+            logger.warning("Fast path failed: %s", e)
+        if final_response is None:
+            return self.query(question, image_base64=image_base64, user_id=user_id, image_bytes=image_bytes)
+
+        _bg_pool.submit(self._safe_mem_save, user_id, question, final_response)
+        return final_response
+
+    def _fast_generate(self, model: str, contents: list) -> types.GenerateContentResponse:
+        client = self._get_client(model)
+        return _gemini_breaker.call(lambda: retry_call(lambda: _with_slot(
+            client.models.generate_content,
+            model=model,
+            contents=contents,
+            config=_FAST_CONFIG
+        )))
 
     def generate_image(self, prompt: str) -> str:
         return self.imager.generate_image(prompt)
@@ -502,19 +1094,16 @@ class VisionsAgent:
 
     def get_live_token(self, model: str = None, expires_minutes: int = 30) -> str:
         """Provision an ephemeral token for Live API (v1alpha)."""
-        client = self._get_client(model or Config.LIVE_AUDIO_MODEL)
-        # Force v1alpha for auth tokens as per docs
-        orig_version = client.http_options.api_version
-        client.http_options.api_version = 'v1alpha'
-        try:
-            now = datetime.datetime.now(tz=datetime.timezone.utc)
-            token = client.auth_tokens.create(
-                config={
-                    'uses': 1,
-                    'expire_time': now + datetime.timedelta(minutes=expires_minutes),
-                    'new_session_expire_time': now + datetime.timedelta(minutes=5)
-                }
-            )
-            return token.name
-        finally:
-            client.http_options.api_version = orig_version
+        self._ensure_initialized()
+        # Auth tokens need v1alpha (per docs): a dedicated pooled client, so the shared one's version never changes
+        location = self.MODEL_LOCATIONS.get(model or Config.LIVE_AUDIO_MODEL, "global")
+        client = vertex_client(self.project, location, api_version='v1alpha')
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        token = client.auth_tokens.create(
+            config={
+                'uses': 1,
+                'expire_time': now + datetime.timedelta(minutes=expires_minutes),
+                'new_session_expire_time': now + datetime.timedelta(minutes=5)
+            }
+        )
+        return token.name
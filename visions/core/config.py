@@ -5,13 +5,14 @@ Load this with: from dotenv import load_dotenv; load_dotenv()
 import os
 from pathlib import Path
 
-# Load .env file
-try:
-    from dotenv import load_dotenv, find_dotenv
-    # find_dotenv() will search upwards from current file to find the project root .env
-    load_dotenv(find_dotenv())
-except ImportError:
-    print("⚠️  python-dotenv not installed. Install with: pip install python-dotenv")
+# Load .env file (skipped when the orchestrator already injected the environment)
+if not (os.environ.get("GOOGLE_AI_STUDIO_API_KEY") and os.environ.get("VERTEX_PROJECT_ID")):
+    try:
+        from dotenv import load_dotenv, find_dotenv
+        # find_dotenv() will search upwards from current file to find the project root .env
+        load_dotenv(find_dotenv())
+    except ImportError:
+        print("⚠️  python-dotenv not installed. Install with: pip install python-dotenv")
 
 class Config:
     """Visions AI Configuration"""
@@ -117,6 +118,12 @@ class Config:
     # Configured Media Resolution
     DEFAULT_MEDIA_RESOLUTION = os.getenv("DEFAULT_MEDIA_RESOLUTION", MEDIA_RES_MEDIUM)
     
+    # Outbound Gemini concurrency cap (keeps bursts under the project's QPM before 429s cascade)
+    GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+    # genai.Client transport: request timeout and how long idle keep-alive connections survive
+    GENAI_HTTP_TIMEOUT_MS = 120_000
+    GENAI_KEEPALIVE_SECONDS = 120.0
+
     # Feature Flags
     ENABLE_AI_STUDIO_FALLBACK = True 
     ENABLE_GEMINI_3_FLASH_FREE = True 
@@ -125,14 +132,22 @@ class Config:
     # Knowledge Base
     CHUNK_SIZE = 4000 
     CHUNK_OVERLAP = 500
+    FAISS_NPROBE = 16  # IVF lists scanned per query on a compacted index (recall vs latency)
+    FAISS_CACHE_TTL_SECONDS = 3600  # Process-wide index is re-synced from GCS after this
+    RAG_MIN_CORPUS = 10  # Smaller indexes aren't worth the embedding round-trip
+    RAG_MIN_QUERY_WORDS = 3  # Shorter queries embed too vaguely to retrieve useful context
+    RAG_CONTEXT_TOKEN_BUDGET = 4000  # Knowledge context cap per synthesis prompt (~4 chars/token)
     # Storage
     GCS_BUCKET = f"{VERTEX_PROJECT_ID}-reasoning-artifacts"
     GCS_MEMORY_BUCKET = f"{VERTEX_PROJECT_ID}-visions-memory"
     VECTOR_STORE_PREFIX = "vector_store"
+    GCS_SYNC_WORKERS = int(os.getenv("GCS_SYNC_WORKERS", "16"))  # Parallel blob downloads on index sync
 
     # BigQuery (Long-Term Analytical Memory)
     BIGQUERY_DATASET = "visions_memory"
     BIGQUERY_TABLE = "interaction_logs"
+    BIGQUERY_BATCH_SIZE = 10       # Rows per batched streaming insert
+    BIGQUERY_FLUSH_SECONDS = 30    # Max time a buffered row waits before flushing
     
     # Local SQL (Short-Term fast access)
     LOCAL_MEMORY_DB = "visions_short_term.db"
@@ -0,0 +1,64 @@
+"""
+Process-wide genai.Client pool.
+Every module that talks to Gemini resolves its client here, so the process holds one
+client (one credential discovery, one warm keep-alive transport) per endpoint.
+Module-level state keeps the classes that use these clients picklable.
+"""
+import importlib.util
+import threading
+from typing import Dict, Optional
+
+import httpx
+from google import genai
+from google.genai import types
+
+from .config import Config
+
+# Keep-alive (and HTTP/2 when `h2` is installed) so bursts reuse warm connections instead of re-handshaking
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_vertex_clients: Dict[tuple, genai.Client] = {}  # (project, location, api_version) -> client
+_studio_clients: Dict[str, genai.Client] = {}  # API key -> client
+_lock = threading.Lock()
+
+
+def http_options(api_version: Optional[str] = None) -> types.HttpOptions:
+    return types.HttpOptions(
+        api_version=api_version,
+        timeout=Config.GENAI_HTTP_TIMEOUT_MS,
+        client_args={
+            "http2": _HTTP2_AVAILABLE,
+            "limits": httpx.Limits(
+                max_connections=Config.GEMINI_MAX_CONCURRENCY * 4,
+                max_keepalive_connections=Config.GEMINI_MAX_CONCURRENCY * 2,
+                keepalive_expiry=Config.GENAI_KEEPALIVE_SECONDS
+            )
+        }
+    )
+
+
+def vertex_client(project: str, location: str, api_version: Optional[str] = None) -> genai.Client:
+    """
+    Shared Vertex AI client for (project, location). Callers needing another API version
+    (e.g. v1alpha for Live auth tokens) get their own pooled client: never mutate a shared one.
+    """
+    key = (project, location, api_version)
+    client = _vertex_clients.get(key)
+    if client is None:
+        with _lock:
+            client = _vertex_clients.get(key)
+            if client is None:
+                client = _vertex_clients[key] = genai.Client(vertexai=True, project=project, location=location,
+                                                             http_options=http_options(api_version))
+    return client
+
+
+def studio_client(api_key: str) -> genai.Client:
+    """Shared Google AI Studio client for an API key."""
+    client = _studio_clients.get(api_key)
+    if client is None:
+        with _lock:
+            client = _studio_clients.get(api_key)
+            if client is None:
+                client = _studio_clients[api_key] = genai.Client(api_key=api_key, http_options=http_options())
+    return client
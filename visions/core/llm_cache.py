@@ -0,0 +1,62 @@
+"""
+Exact-match cache for generated media.
+Identical requests (same model, prompt and config) are served from disk instead of
+paying for another generation: an in-memory LRU in front of one file per key.
+"""
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path("outputs") / ".cache"
+
+
+class LLMCache:
+    """Bytes keyed by `LLMCache.key(...)`, stored as `<cache_dir>/<hex>.bin`."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, memory_items: int = 256):
+        self.cache_dir = Path(cache_dir)
+        self.memory_items = memory_items
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(**request) -> str:
+        """Stable digest of everything that determines the output."""
+        return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.bin"
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes):
+        self._remember(key, data)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path(key).with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            pass  # Disk tier is best-effort; the memory tier still serves this process
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
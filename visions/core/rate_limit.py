@@ -0,0 +1,126 @@
+"""
+Client-side rate limiting for outbound model calls.
+Paces requests before they are sent, so quota is spent on calls that can
+succeed instead of on 429 round-trips.
+"""
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Per-model quotas (Google AI Studio - Tier 1 Paid). These are hard caps regardless of budget!
+RATE_LIMITS = {
+    # Gemini 3
+    "gemini-3-pro": {"rpm": 25, "tpm": 1_000_000, "rpd": 250},
+    "gemini-3-pro-image": {"rpm": 20, "tpm": 100_000, "rpd": 250},
+    
+    # Gemini 2.5
+    "gemini-2.5-pro": {"rpm": 15, "tpm": 1_000_000, "rpd": 300},
+    "gemini-2.5-flash": {"rpm": 1000, "tpm": 1_000_000, "rpd": 10_000},
+    "gemini-2.5-flash-lite": {"rpm": 4000, "tpm": 4_000_000, "rpd": "unlimited"},
+    "gemini-2.5-flash-image": {"rpm": 500, "tpm": 500_000, "rpd": 2000},
+    
+    # Gemini 2.0
+    "gemini-2.0-flash": {"rpm": 2000, "tpm": 4_000_000, "rpd": "unlimited"},
+    "gemini-2.0-flash-lite": {"rpm": 4000, "tpm": 4_000_000, "rpd": "unlimited"},
+    
+    # Imagen 4
+    "imagen-4-fast": {"rpm": 10, "rpd": 70},
+    "imagen-4-standard": {"rpm": 10, "rpd": 70},
+    "imagen-4-ultra": {"rpm": 5, "rpd": 30},
+    
+    # Veo 3
+    "veo-3-standard": {"rpm": 2, "rpd": 10},
+    "veo-3-fast": {"rpm": 2, "rpd": 10},
+}
+
+
+class TokenBucket:
+    """
+    Bursts of up to `capacity` calls go straight through; beyond that, calls are
+    paced at `refill_rate` tokens per second. `take()` reserves a token and returns
+    how long the caller must sleep before using it (0.0 when one was available).
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, cost: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+            # Reserve even when short: concurrent callers queue up behind each other
+            self._tokens -= cost
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.refill_rate
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a key's daily request quota is already spent."""
+
+
+class SlidingWindowLimiter:
+    """
+    Per-key RPM/RPD enforcement with the two-counter sliding window: the previous
+    fixed window's count is weighted by how much of it still overlaps the sliding
+    window, plus the current window's count. Unlike a fixed window this has no
+    boundary stampede, and it needs two integers per key instead of a timestamp log.
+
+    `allow()` blocks until the call fits under `rpm`; a spent `rpd` raises
+    RateLimitExceeded instead, since waiting out a day inline is never useful.
+    """
+
+    MINUTE = 60.0
+    DAY = 86_400.0
+
+    def __init__(self):
+        self._windows: Dict[Tuple[str, float], List[float]] = {}  # (key, span) -> [prev, cur, window_start]
+        self._lock = threading.Lock()
+
+    def _window(self, key: str, span: float, now: float) -> Tuple[List[float], float]:
+        window = self._windows.get((key, span))
+        if window is None:
+            window = self._windows[(key, span)] = [0, 0, now]
+        elapsed = now - window[2]
+        if elapsed >= span:
+            # Rotate; after a gap of two or more spans there is nothing left to carry over
+            window[0] = window[1] if elapsed < 2 * span else 0
+            window[1] = 0
+            window[2] += span * (elapsed // span)
+            elapsed = now - window[2]
+        return window, elapsed
+
+    def allow(self, key: str, rpm: int, rpd: Optional[int] = None) -> float:
+        """Counts one request against `key`, sleeping first if needed. Returns seconds slept."""
+        daily = isinstance(rpd, int)  # RATE_LIMITS uses "unlimited" for uncapped days
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if daily:
+                    day, elapsed = self._window(key, self.DAY, now)
+                    if day[0] * (1 - elapsed / self.DAY) + day[1] >= rpd:
+                        # Worded without "quota"/"429" so callers' retry-on-quota loops don't spin on it
+                        raise RateLimitExceeded(f"Daily cap for {key} ({rpd} requests) reached")
+                minute, elapsed = self._window(key, self.MINUTE, now)
+                prev, cur = minute[0], minute[1]
+                if prev * (1 - elapsed / self.MINUTE) + cur < rpm:
+                    minute[1] += 1
+                    if daily:
+                        day[1] += 1
+                    return waited
+                if cur >= rpm or not prev:
+                    delay = self.MINUTE - elapsed  # Only the next window has room
+                else:
+                    # Until the previous window's weighted share has decayed enough for one more call
+                    delay = self.MINUTE * (1 - (rpm - cur) / prev) - elapsed
+                delay = max(delay, 0.05)
+            time.sleep(delay)
+            waited += delay
+
+
+# Process-wide: quotas belong to the project, not to any one generator instance
+limiter = SlidingWindowLimiter()
@@ -0,0 +1,156 @@
+"""
+Resilience primitives for outbound model calls.
+Exponential backoff with full jitter, plus a small circuit breaker so a
+partial outage doesn't turn every concurrent request into a retry storm.
+"""
+import re
+import time
+import random
+import logging
+import threading
+import httpx
+from typing import Callable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("visions-resilience")
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying (timeout, quota, overload, transient server/gateway failure)
+TRANSIENT_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# Canonical status names, for errors that carry no numeric code (e.g. gRPC-style messages)
+TRANSIENT_STATUSES = ("resource_exhausted", "resource exhausted", "unavailable",
+                      "deadline_exceeded", "deadline exceeded")
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    True when the error looks like a retryable quota/availability blip.
+    API errors (google.genai APIError, google.api_core exceptions) are judged by their
+    numeric `code` alone, so a 400 whose message happens to contain "500" is not retried.
+    """
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in TRANSIENT_CODES
+    if isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True  # Connect/read timeouts and dropped connections never reached a status
+    message = str(error).lower()
+    return any(status in message for status in TRANSIENT_STATUSES)
+
+
+def is_quota(error: Exception) -> bool:
+    """True for a quota/rate-limit rejection (429 / RESOURCE_EXHAUSTED) only, not other transient failures."""
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code == 429
+    message = str(error).lower()
+    return "quota" in message or "resource_exhausted" in message or "resource exhausted" in message
+
+
+# Server retry hints in error text: "Retry-After: 7", the API's "retryDelay": "3s", "Please retry in 3.2s"
+_RETRY_HINT = re.compile(r'retry(?:[_ -]?after|[_ -]?delay|\s+in)[^0-9]{0,8}(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def retry_hint(error: Exception) -> Optional[float]:
+    """Seconds the server asked callers to wait before retrying, if the error says."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        value = headers.get("retry-after")
+        if value and value.strip().isdigit():
+            return float(value)
+    match = _RETRY_HINT.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+def retry_call(func: Callable[[], T], retries: int = 3, base_delay: float = 0.2, max_delay: float = 4.0,
+               max_total_sleep: Optional[float] = None, retry_if: Callable[[Exception], bool] = is_transient,
+               jitter: Tuple[float, float] = (0.0, 1.0)) -> T:
+    """
+    Call `func` with exponential backoff on errors `retry_if` accepts (transient ones by default).
+    The backoff (capped at `max_delay`) is scaled by uniform(*jitter): full jitter by default.
+    A server retry hint replaces the jittered delay (still capped at `max_delay`).
+    Other errors are raised immediately, and so is a retryable one once the
+    next sleep would take total waiting past `max_total_sleep`.
+    """
+    slept = 0.0
+    for attempt in range(retries):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == retries - 1 or not retry_if(e):
+                raise
+            hint = retry_hint(e)
+            if hint is not None:
+                delay = min(max_delay, hint)
+            else:
+                delay = min(max_delay, base_delay * (2 ** attempt)) * random.uniform(*jitter)
+            if max_total_sleep is not None and slept + delay > max_total_sleep:
+                raise
+            logger.warning("⚠️ Transient failure (%s). Retrying in %.2fs... (Attempt %d/%d)", e, delay, attempt + 1, retries)
+            time.sleep(delay)
+            slept += delay
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised while the breaker is open and calls are being short-circuited."""
+
+
+class CircuitBreaker:
+    """
+    Trips after `fail_threshold` consecutive transient failures and rejects calls
+    for `reset_timeout` seconds. After that a probe is let through: success closes
+    the circuit, another failure re-opens it immediately. With `max_reset_timeout`
+    set, each failed probe doubles the cooldown up to that cap (reset on success).
+    """
+
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 30.0, name: str = "gemini",
+                 max_reset_timeout: float = None):
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.name = name
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def call(self, func: Callable[[], T]) -> T:
+        with self._lock:
+            if self._opened_at is not None:
+                remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(f"Circuit '{self.name}' open; retry in {remaining:.0f}s")
+                # Half-open: one more failure re-trips straight away
+                self._opened_at = None
+                self._failures = self.fail_threshold - 1
+                self._probing = True
+        try:
+            result = func()
+        except Exception as e:
+            if is_transient(e):
+                self._record_failure()
+            raise
+        self._record_success()
+        return result
+
+    def _record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_threshold and self._opened_at is None:
+                if self._probing and self.max_reset_timeout:
+                    self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._probing = False
+                self._opened_at = time.monotonic()
+                logger.error("🔌 Circuit '%s' tripped after %d failures. Cooling down %ss.", self.name, self._failures, self.reset_timeout)
+
+    def _record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+            self.reset_timeout = self.base_reset_timeout
@@ -118,6 +118,16 @@ class PromptPattern(BaseModel):
     example_prompt: str = Field(description="Example of successful prompt")
     recommendations: List[str] = Field(description="Recommendations for using this pattern")
 
+# ============================================================================
+# Query Routing Schema
+# ============================================================================
+
+class RoutingDecision(BaseModel):
+    """Triage verdict used by the agent's smart router"""
+    is_high_risk: bool = Field(description="Whether the query touches high-risk territory")
+    complexity: int = Field(ge=1, le=10, description="Reasoning complexity (1-10)")
+    needs_search: bool = Field(description="Whether live web grounding is required")
+
 # ============================================================================
 # System Status Schema
 # ============================================================================
@@ -1,10 +1,66 @@
 
 import os
+import sys
+import json
 import yaml
-import glob
-from typing import Dict, List, Optional
+import logging
+import threading
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
+logger = logging.getLogger("visions-skills")
+
+# libyaml-backed loader when PyYAML was built with it (~10x faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Plain scalars YAML would type (bool/null/merge) or that need its full grammar
+_YAML_SPECIAL_LEADS = frozenset("{}[]|>&*!%@`\"',#-?+.0123456789~=")
+_YAML_TYPED_WORDS = frozenset(("true", "false", "yes", "no", "on", "off", "null", "<<"))
+
+
+def _json_native(value: Any) -> bool:
+    """True when `value` survives a JSON round-trip unchanged."""
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return value == value and value not in (float("inf"), float("-inf"))
+    if isinstance(value, list):
+        return all(_json_native(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _json_native(v) for k, v in value.items())
+    return False
+
+
+def _fast_frontmatter(frontmatter: str) -> Optional[dict]:
+    """
+    Parses flat `key: plain string` frontmatter without PyYAML. Returns None as soon
+    as a line needs real YAML (nesting, quoting, flow/block syntax, typed scalars).
+    """
+    meta = {}
+    for line in frontmatter.splitlines():
+        if not line or line.isspace() or line.startswith("#"):
+            continue
+        if line[0].isspace():
+            return None
+        key, sep, value = line.partition(":")
+        key, value = key.strip(), value.strip()
+        if (not sep or not value or line[0] in _YAML_SPECIAL_LEADS or value[0] in _YAML_SPECIAL_LEADS
+                or ": " in value or value.endswith(":") or " #" in line or "\t" in line
+                or value.lower() in _YAML_TYPED_WORDS or key.lower() in _YAML_TYPED_WORDS):
+            return None
+        meta[key] = value
+    return meta
+
+
 @dataclass
 class SkillMetadata:
     name: str
@@ -24,8 +80,16 @@ class SkillRegistry:
     - Level 1: Metadata (System Prompt)
     - Level 2: Instructions (On-Demand Activation)
     - Level 3: Execution (Script capabilities)
+
+    Construction does no I/O: the skills directory is scanned on first use.
+    `SkillRegistry.instance()` returns the process-wide registry.
     """
 
+    _instance: Optional["SkillRegistry"] = None
+    _instance_lock = threading.Lock()
+
+    MAX_CACHED_SKILL_CHARS = 256 * 1024  # Skills are small; anything bigger is re-read per activation
+
     def __init__(self, skills_dir: str = None):
         if skills_dir is None:
             # Default to visions/skills relative to this file
@@ -35,99 +99,213 @@ class SkillRegistry:
             self.skills_dir = skills_dir
         
         self.skills: Dict[str, SkillMetadata] = {}
-        self._scan_skills()
+        # SKILL.md path -> (mtime_ns, frontmatter); persisted so a restart skips YAML for unchanged skills.
+        # Plain JSON, never pickle: loading it must not be able to run code.
+        self._cache_path = os.path.join(self.skills_dir, ".skills_cache.json")
+        self._parsed: Optional[Dict[str, tuple]] = None
+        self._scanned = False
+        self._scan_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "SkillRegistry":
+        """The shared registry for the default skills directory."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _ensure_scanned(self):
+        if self._scanned:
+            return
+        with self._scan_lock:
+            if not self._scanned:
+                self._scan_skills()
 
     def _scan_skills(self):
         """Scans the skills directory for valid SKILL.md files and programs."""
+        if self._parsed is None:
+            self._parsed = self._load_parse_cache()
         self.skills = {}
-        # Look for vision/skills/*/SKILL.md
-        pattern = os.path.join(self.skills_dir, "*", "SKILL.md")
-        skill_files = glob.glob(pattern)
+        self._snippet: Optional[str] = None
+        self._content_cache: Dict[str, tuple] = {}  # skill name -> (mtime_ns, rendered content)
+        logger.debug("🔍 SkillRegistry: Scanning %s...", self.skills_dir)
 
-        print(f"🔍 SkillRegistry: Scanning {self.skills_dir}...")
-        
-        for file_path in skill_files:
+        # Look for visions/skills/*/SKILL.md in one directory pass (DirEntry caches the type)
+        try:
+            with os.scandir(self.skills_dir) as entries:
+                skill_dirs = [entry.path for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            skill_dirs = []
+
+        seen = {}
+        for skill_dir in skill_dirs:
+            file_path = os.path.join(skill_dir, "SKILL.md")
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Parse Frontmatter (simple implementation)
-                if content.startswith("---"):
-                    parts = content.split("---", 2)
-                    if len(parts) >= 3:
-                        frontmatter_raw = parts[1]
-                        meta = yaml.safe_load(frontmatter_raw)
-                        
-                        if meta and 'name' in meta and 'description' in meta:
-                            # Check for programs directory
-                            skill_dir = os.path.dirname(file_path)
-                            programs_dir = os.path.join(skill_dir, "programs")
-                            programs = []
-                            if os.path.exists(programs_dir) and os.path.isdir(programs_dir):
-                                # Find .py files
-                                py_files = glob.glob(os.path.join(programs_dir, "*.py"))
-                                programs = [os.path.basename(p) for p in py_files]
-
-                            skill = SkillMetadata(
-                                name=meta['name'],
-                                description=meta['description'],
-                                usage_trigger=meta.get('usage_trigger', ''),
-                                path=file_path,
-                                programs=programs
-                            )
-                            self.skills[skill.name] = skill
-                            prog_msg = f" (Programs: {programs})" if programs else ""
-                            print(f"   ✅ Loaded Skill: {skill.name}{prog_msg}")
-                        else:
-                            print(f"   ⚠️ Invalid frontmatter in {file_path}")
+                # Rescans only re-parse SKILL.md files that changed since the last pass
+                cached = self._parsed.get(file_path)
+                if cached is not None and cached[0] == mtime:
+                    meta = cached[1]
+                else:
+                    meta = self._read_frontmatter(file_path)
+                seen[file_path] = (mtime, meta)
+                if meta is None:
+                    continue
+
+                if 'name' in meta and 'description' in meta:
+                    programs = self._list_programs(skill_dir)
+                    skill = SkillMetadata(
+                        name=sys.intern(meta['name']),
+                        description=meta['description'],
+                        usage_trigger=meta.get('usage_trigger', ''),
+                        path=file_path,
+                        programs=programs
+                    )
+                    self.skills[sys.intern(skill.name)] = skill
+                    logger.debug("✅ Loaded Skill: %s (Programs: %s)", skill.name, programs)
+                else:
+                    logger.warning("⚠️ Invalid frontmatter in %s", file_path)
             except Exception as e:
-                print(f"   ❌ Error loading skill from {file_path}: {e}")
+                logger.error("❌ Error loading skill from %s: %s", file_path, e)
+
+        if seen != self._parsed:
+            self._parsed = seen
+            self._save_parse_cache()
+        self._scanned = True
+        logger.info("🛠️ SkillRegistry: %d skills loaded from %s", len(self.skills), self.skills_dir)
+
+    def _load_parse_cache(self) -> Dict[str, tuple]:
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except Exception:
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        # Anything malformed is dropped: that skill is simply parsed again
+        return {path: (entry[0], entry[1]) for path, entry in cache.items()
+                if isinstance(entry, list) and len(entry) == 2 and type(entry[0]) is int
+                and (entry[1] is None or isinstance(entry[1], dict))}
+
+    def _save_parse_cache(self):
+        # Frontmatter YAML typed beyond JSON (dates, ...) would come back as something else: re-parse those instead
+        cache = {path: entry for path, entry in self._parsed.items() if _json_native(entry[1])}
+        try:
+            tmp_path = f"{self._cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(cache))
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, TypeError, ValueError):
+            pass  # Read-only skills dir (e.g. a baked container image): parse again next start
 
-        print(f"   Total Skills Loaded: {len(self.skills)}")
+    @staticmethod
+    def _read_frontmatter(file_path: str) -> Optional[dict]:
+        """
+        Parses the frontmatter of a SKILL.md. None when the file has no frontmatter block.
+        Accepted forms: YAML between `---` fences, TOML between `+++` fences, or a leading
+        JSON object. TOML and JSON go through C-backed stdlib parsers; prefer them for new skills.
+        """
+        # The header is virtually always in the first 4 KB; the body is only read on activation
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read(4096)
+            fence = content[:3]
+            if fence in ("---", "+++"):
+                frontmatter, sep, _ = content[3:].partition(fence)
+                if not sep:
+                    frontmatter, sep, _ = (content[3:] + f.read()).partition(fence)
+                if not sep:
+                    return None
+            elif fence.startswith("{"):
+                try:
+                    return json.JSONDecoder().raw_decode(content)[0]
+                except ValueError:
+                    return json.JSONDecoder().raw_decode(content + f.read())[0]
+            else:
+                return None
+
+        if fence == "+++":
+            import tomllib
+            return tomllib.loads(frontmatter)
+        meta = _fast_frontmatter(frontmatter)
+        if meta is None:
+            meta = yaml.load(frontmatter, Loader=_YAML_LOADER)
+        return meta or {}
+
+    @staticmethod
+    def _list_programs(skill_dir: str) -> List[str]:
+        """Names of the .py files in a skill's programs/ directory."""
+        try:
+            with os.scandir(os.path.join(skill_dir, "programs")) as entries:
+                return [entry.name for entry in entries if entry.name.endswith(".py") and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
     def get_system_prompt_snippet(self) -> str:
         """Generates the 'Available Skills' section for the System Prompt."""
+        self._ensure_scanned()
+        if self._snippet is not None:
+            return self._snippet
         if not self.skills:
-            return ""
+            self._snippet = ""
+            return self._snippet
 
-        snippet = "\n\n# 🛠️ AVAILABLE AGENT SKILLS\n"
-        snippet += "You have access to the following domain-specific skills. "
-        snippet += "Use the `activate_skill` tool to load their full instructions when needed.\n\n"
-        
+        lines = [
+            "\n\n# 🛠️ AVAILABLE AGENT SKILLS\n",
+            "You have access to the following domain-specific skills. ",
+            "Use the `activate_skill` tool to load their full instructions when needed.\n\n",
+        ]
         for name, skill in self.skills.items():
-            snippet += f"- **{name}**: {skill.description}\n"
+            lines.append(f"- **{name}**: {skill.description}\n")
             if skill.usage_trigger:
-                snippet += f"  - *Trigger*: {skill.usage_trigger}\n"
-        
-        return snippet
+                lines.append(f"  - *Trigger*: {skill.usage_trigger}\n")
+
+        # Rendered once per scan; _scan_skills clears it
+        self._snippet = "".join(lines)
+        return self._snippet
 
     def get_skill_content(self, skill_name: str) -> str:
         """Reads the full content of a skill's SKILL.md and appends program info."""
+        self._ensure_scanned()
         if skill_name not in self.skills:
             return f"Error: Skill '{skill_name}' not found."
         
         try:
             skill = self.skills[skill_name]
+            # Level 2 activation is served from memory until SKILL.md changes on disk
+            mtime = os.stat(skill.path).st_mtime_ns
+            cached = self._content_cache.get(skill_name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
             with open(skill.path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                body = f.read()
             
             # Append Level 3 Info
+            lines = [body]
             if skill.programs:
-                content += "\n\n# 💻 LEVEL 3: EXECUTABLE PROGRAMS\n"
-                content += "The following executable programs are available for this skill. "
-                content += "Use the `run_skill_program` tool to execute them.\n\n"
-                for prog in skill.programs:
-                    content += f"- `{prog}`\n"
-            
+                lines.append("\n\n# 💻 LEVEL 3: EXECUTABLE PROGRAMS\n")
+                lines.append("The following executable programs are available for this skill. ")
+                lines.append("Use the `run_skill_program` tool to execute them.\n\n")
+                lines.extend(f"- `{prog}`\n" for prog in skill.programs)
+            content = "".join(lines)
+
+            if len(body) <= self.MAX_CACHED_SKILL_CHARS:
+                self._content_cache[skill_name] = (mtime, content)
             return content
         except Exception as e:
             return f"Error reading skill file: {e}"
 
     def list_skills(self) -> List[str]:
+        self._ensure_scanned()
         return list(self.skills.keys())
     
     def get_program_path(self, skill_name: str, program_name: str) -> Optional[str]:
         """Resolves the absolute path to a skill program."""
+        self._ensure_scanned()
         if skill_name not in self.skills:
             return None
         
@@ -4,9 +4,17 @@ Visions AI Backend Configuration
 """
 
 import os
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Protocol, Optional
 
+# Root of repository, resolved once at import
+# visions/core/visions_backend.py -> visions/core -> visions -> ROOT
+_BASE_DIR = Path(__file__).parent.parent.parent
+_CURRICULUM_DIR = str(_BASE_DIR / "curriculum")
+_OUTPUTS_DIR = str(_BASE_DIR / "outputs")
+
 # Note: These imports will work once deepagents is installed
 # For now, we'll define the structure to match the API
 
@@ -17,13 +25,18 @@ class BackendProtocol(Protocol):
 
 class CompositeBackend:
     """Routes paths to different backends."""
+    __slots__ = ("default", "routes", "_sorted_routes")
+
     def __init__(self, default, routes: dict):
         self.default = default
         self.routes = routes
+        # Longest prefix first, sorted once rather than on every route() call
+        self._sorted_routes = sorted(((sys.intern(prefix), backend) for prefix, backend in routes.items()),
+                                     key=lambda x: len(x[0]), reverse=True)
         
     def route(self, path: str):
         """Route path to appropriate backend."""
-        for prefix, backend in sorted(self.routes.items(), key=lambda x: len(x[0]), reverse=True):
+        for prefix, backend in self._sorted_routes:
             if path.startswith(prefix):
                 return backend
         return self.default
@@ -31,35 +44,48 @@ class CompositeBackend:
 
 class StateBackend:
     """Ephemeral in-memory storage for session."""
+    __slots__ = ("runtime",)
+
     def __init__(self, runtime):
         self.runtime = runtime
         
         
 class StoreBackend:
     """Persistent cross-thread storage."""
+    __slots__ = ("runtime",)
+
     def __init__(self, runtime):
         self.runtime = runtime
 
 
 class FilesystemBackend:
     """Real filesystem access with optional sandboxing."""
-    def __init__(self, root_dir: str, virtual_mode: bool = False):
-        self.root_dir = Path(root_dir).resolve()
+    __slots__ = ("root_dir", "virtual_mode")
+    _ensured_roots: set = set()  # Roots already mkdir'd by this process
+
+    def __init__(self, root_dir: str, virtual_mode: bool = False, resolve_symlinks: bool = False):
+        # abspath is pure string work; resolve() stats every path segment, so it's opt-in
+        self.root_dir = Path(root_dir).resolve() if resolve_symlinks else Path(os.path.abspath(root_dir))
         self.virtual_mode = virtual_mode
         
-        # Ensure directory exists
-        self.root_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists (once per process per root)
+        if self.root_dir not in FilesystemBackend._ensured_roots:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            FilesystemBackend._ensured_roots.add(self.root_dir)
 
 
 class GuardedBackend(FilesystemBackend):
     """Filesystem backend with write protection."""
+    __slots__ = ("deny_prefixes",)
+
     def __init__(self, deny_prefixes: list[str], **kwargs):
         super().__init__(**kwargs)
-        self.deny_prefixes = [p if p.endswith("/") else p + "/" for p in deny_prefixes]
+        # A tuple lets str.startswith test every prefix in one C call
+        self.deny_prefixes = tuple(p if p.endswith("/") else p + "/" for p in deny_prefixes)
         
     def _is_write_allowed(self, path: str) -> bool:
         """Check if write operations are allowed for this path."""
-        return not any(path.startswith(p) for p in self.deny_prefixes)
+        return not path.startswith(self.deny_prefixes)
 
 
 def create_visions_backend(runtime):
@@ -79,22 +105,16 @@ def create_visions_backend(runtime):
         CompositeBackend configured for Visions AI
     """
     
-    # Get base directory (Root of repository)
-    # visions/core/visions_backend.py -> visions/core -> visions -> ROOT
-    base_dir = Path(__file__).parent.parent.parent
-    
     # Zone 1: Read-only curriculum (protected)
-    curriculum_path = base_dir / "curriculum"
     curriculum_backend = GuardedBackend(
         deny_prefixes=["/knowledge/"],  # Read-only
-        root_dir=str(curriculum_path),
+        root_dir=_CURRICULUM_DIR,
         virtual_mode=True
     )
     
     # Zone 2: Output storage
-    outputs_path = base_dir / "outputs"
     outputs_backend = FilesystemBackend(
-        root_dir=str(outputs_path),
+        root_dir=_OUTPUTS_DIR,
         virtual_mode=True
     )
     
@@ -109,16 +129,16 @@ def create_visions_backend(runtime):
     )
 
 
-# Storage path structure
-VISIONS_PATHS = {
+# Storage path structure (read-only views: shared by every importer)
+VISIONS_PATHS = MappingProxyType({
     "workspace": "/workspace/",
     "knowledge": "/knowledge/",
     "memories": "/memories/",
     "generated": "/generated/",
-}
+})
 
 # Example paths
-VISIONS_FILES = {
+VISIONS_FILES = MappingProxyType({
     # Workspace (ephemeral)
     "plan": "/workspace/plan.md",
     "notes": "/workspace/research_notes.txt",
@@ -138,7 +158,7 @@ VISIONS_FILES = {
     # Generated (persistent outputs)
     "images": "/generated/images/",
     "videos": "/generated/videos/",
-}
+})
 
 
 if __name__ == "__main__":
@@ -151,9 +171,8 @@ if __name__ == "__main__":
     print(f"  /generated/  → FilesystemBackend (outputs)")
     print("\nPaths verified:")
     
-    base = Path(__file__).parent.parent.parent
     for zone, path in VISIONS_PATHS.items():
-        actual_path = base / zone.replace("/", "")
+        actual_path = _BASE_DIR / zone.replace("/", "")
         if actual_path.exists():
             print(f"  ✅ {path} → {actual_path}")
         else:
@@ -1,23 +1,122 @@
 
-from google import genai
-from google.genai import types
 from visions.core.config import Config
 import datetime
+import concurrent.futures
+import hashlib
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from google.genai import types
+
+logger = logging.getLogger("visions-cache")
+
+
+def _client(project_id: str, location: str):
+    from visions.core.genai_pool import vertex_client  # Deferred: the genai import graph is heavy and most entrypoints never cache
+    return vertex_client(project_id, location)
+
+
+# One TTL refresher for the whole process. Managers are held weakly: an unused manager is still
+# collected, and its caches then simply expire server-side on their own TTL.
+_tracking = weakref.WeakSet()
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def _refresh_all():
+    for manager in list(_tracking):
+        manager._refresh()
+
+
+def _refresh_loop():
+    while True:
+        time.sleep(CacheManager.REFRESH_INTERVAL_SECONDS)
+        _refresh_all()  # Its own frame: no manager reference survives between passes
+
+
+def _ensure_refresher():
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = threading.Thread(target=_refresh_loop, name="visions-cache-ttl", daemon=True)
+            _refresher.start()
+
+
+def _fingerprint(content_list: list, model_name: str, system_instruction: str = None) -> str:
+    """Stable digest of what a cache would hold; identical requests map to one server-side cache."""
+    h = hashlib.blake2b(model_name.encode(), digest_size=16)
+    h.update(b"\0" + (system_instruction or "").encode())
+    for part in content_list:
+        if hasattr(part, "model_dump_json"):  # genai Content/Part/File
+            serialized = part.model_dump_json(exclude_none=True)
+        else:
+            serialized = json.dumps(part, sort_keys=True, default=str)
+        h.update(b"\0" + serialized.encode())
+    return h.hexdigest()
 
 class CacheManager:
     """
     Manages Gemini Context Caching for cost optimization on large contexts.
     Implements Cookbook Pattern 14 (Caching.ipynb).
+
+    Caches created here are kept alive off the request path: one shared daemon thread
+    re-extends the TTL of any cache used within its TTL window and deletes
+    the ones that went cold. Call `touch(name)` whenever a cache is used.
     """
+
+    REFRESH_INTERVAL_SECONDS = 60
+    FINGERPRINT_CACHE_SIZE = 128
     
     def __init__(self, project_id: str, location: str = "global"):
-        self.client = genai.Client(vertexai=True, project=project_id, location=location)
+        self.client = _client(project_id, location)
+        # name -> [last_used, ttl_minutes, last_refreshed] (monotonic seconds)
+        self._live: Dict[str, List[float]] = {}
+        self._live_lock = threading.Lock()
+        self._by_fingerprint: "OrderedDict[str, str]" = OrderedDict()  # content digest -> cache name (LRU)
+
+    def touch(self, name: str):
+        """Marks a cache as used so the background refresher keeps it alive."""
+        with self._live_lock:
+            entry = self._live.get(name)
+            if entry is not None:
+                entry[0] = time.monotonic()
+
+    def _track(self, name: str, ttl_minutes: int):
+        now = time.monotonic()
+        with self._live_lock:
+            self._live[name] = [now, ttl_minutes, now]
+        _tracking.add(self)
+        _ensure_refresher()
+
+    def _refresh(self):
+        """One refresher pass: extend warm caches, delete cold ones."""
+        now = time.monotonic()
+        with self._live_lock:
+            snapshot = [(name, *entry) for name, entry in self._live.items()]
+        for name, last_used, ttl_minutes, last_refreshed in snapshot:
+            ttl_seconds = ttl_minutes * 60
+            try:
+                if now - last_used > ttl_seconds:
+                    self.delete_cache(name)  # Cold: stop paying storage
+                elif now - last_refreshed > ttl_seconds / 2:
+                    self.update_ttl(name, ttl_minutes)
+                    with self._live_lock:
+                        if name in self._live:
+                            self._live[name][2] = now
+            except Exception as e:
+                logger.warning("⚠️ Cache TTL refresh failed for %s: %s", name, e)
 
     def create_cache(self, 
                      content_list: list, 
                      model_name: str, 
                      ttl_minutes: int = 60,
-                     system_instruction: str = None) -> types.CachedContent:
+                     system_instruction: str = None) -> "types.CachedContent":
         """
         Creates a new cached content object.
         
@@ -28,8 +127,29 @@ class CacheManager:
             system_instruction: Optional system instruction to bake into the cache.
             
         Returns:
-            The created CachedContent object.
+            The created CachedContent object (an existing one if identical content is already cached;
+            its TTL is moved to `ttl_minutes` when that differs).
         """
+        fingerprint = _fingerprint(content_list, model_name, system_instruction)
+        with self._live_lock:
+            name = self._by_fingerprint.get(fingerprint)
+            if name is not None:
+                self._by_fingerprint.move_to_end(fingerprint)
+        if name is not None:
+            try:
+                cache = self.get_cache(name)
+            except Exception:
+                cache = None  # Expired or deleted server-side: create it again
+            if cache is not None:
+                with self._live_lock:
+                    entry = self._live.get(name)
+                    tracked_ttl = entry[1] if entry is not None else None
+                if tracked_ttl != ttl_minutes:
+                    # Same content, different TTL: move the cache (and the refresher) onto the requested one
+                    self.update_ttl(name, ttl_minutes)
+                    self._track(name, ttl_minutes)
+                return cache
+
         config = {
             'contents': content_list,
             'ttl': f"{ttl_minutes * 60}s"
@@ -38,31 +158,62 @@ class CacheManager:
         if system_instruction:
             config['system_instruction'] = system_instruction
             
-        print(f"📦 Creating cache for model {model_name} with TTL {ttl_minutes}m...")
+        logger.info("📦 Creating cache for model %s with TTL %sm...", model_name, ttl_minutes)
         cache = self.client.caches.create(
             model=model_name,
             config=config
         )
-        print(f"✅ Cache created: {cache.name} ({cache.usage_metadata.total_token_count} tokens)")
+        logger.info("✅ Cache created: %s (%s tokens)", cache.name, cache.usage_metadata.total_token_count)
+        self._track(cache.name, ttl_minutes)
+        with self._live_lock:
+            self._by_fingerprint[fingerprint] = cache.name
+            if len(self._by_fingerprint) > self.FINGERPRINT_CACHE_SIZE:
+                self._by_fingerprint.popitem(last=False)
         return cache
 
-    def get_cache(self, name: str) -> types.CachedContent:
+    def get_cache(self, name: str) -> "types.CachedContent":
         """Retrieves an existing cache by name."""
+        self.touch(name)
         return self.client.caches.get(name=name)
 
     def update_ttl(self, name: str, ttl_minutes: int):
         """Updates the TTL of an existing cache."""
+        from google.genai import types
         self.client.caches.update(
             name=name,
             config=types.UpdateCachedContentConfig(ttl=f"{ttl_minutes * 60}s")
         )
-        print(f"🔄 Updated TTL for {name} to {ttl_minutes}m")
+        logger.debug("🔄 Updated TTL for %s to %sm", name, ttl_minutes)
 
     def delete_cache(self, name: str):
         """Deletes a cache to stop billing."""
         self.client.caches.delete(name=name)
-        print(f"🗑️ Deleted cache: {name}")
+        with self._live_lock:
+            self._live.pop(name, None)
+        logger.info("🗑️ Deleted cache: %s", name)
 
     def list_caches(self):
         """Lists all active caches."""
         return self.client.caches.list()
+
+    def purge_caches(self, max_age_minutes: int = 120, max_workers: int = 8) -> int:
+        """
+        Deletes every cache not updated within `max_age_minutes`, issuing the deletes in parallel.
+        Returns how many were deleted.
+        """
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=max_age_minutes)
+        stale = [c.name for c in self.list_caches() if c.update_time and c.update_time < cutoff]
+        if not stale:
+            return 0
+
+        def delete(name: str) -> bool:
+            try:
+                self.delete_cache(name)
+                return True
+            except Exception as e:  # Already gone is fine: deletes are idempotent
+                logger.warning("⚠️ Could not delete cache %s: %s", name, e)
+                return False
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(stale)),
+                                                   thread_name_prefix="visions-cache-purge") as pool:
+            return sum(pool.map(delete, stale))
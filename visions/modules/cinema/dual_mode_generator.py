@@ -5,73 +5,102 @@ This ensures continuous availability even during quota exhaustion
 """
 from google import genai
 from google.genai import types
-import vertexai
 import os
 import time
-from datetime import datetime, timedelta
 from visions.core.config import Config
+from visions.core.genai_pool import studio_client, vertex_client
+from visions.core.llm_cache import LLMCache
+from visions.core.rate_limit import RATE_LIMITS, RateLimitExceeded, TokenBucket, limiter
+from visions.core.resilience import CircuitBreaker, CircuitOpenError
+
+_IMAGE_QUOTA = RATE_LIMITS["gemini-3-pro-image"]
 
 class DualModeImageGenerator:
     """
     Image generator that uses Vertex AI first, falls back to AI Studio if quota exhausted
-    Includes 60-second rate limiting to prevent 429 errors
+    Per-provider token buckets: a burst of `burst` requests runs immediately, then one
+    request per `rate_limit_seconds` to prevent 429 errors
     """
     def __init__(self, 
                  project_id: str = "endless-duality-480201-t3",
                  ai_studio_key: str = None,
-                 rate_limit_seconds: int = 60):
+                 rate_limit_seconds: int = 60,
+                 burst: int = 5,
+                 cache: LLMCache = None):
         self.project_id = project_id
         self.ai_studio_key = ai_studio_key or os.getenv("GOOGLE_AI_STUDIO_API_KEY")
         self.rate_limit_seconds = rate_limit_seconds
         
-        # Rate limiting tracking
-        self.last_vertex_request = None
-        self.last_ai_studio_request = None
+        # Rate limiting (one bucket per provider quota)
+        self.vertex_bucket = TokenBucket(capacity=burst, refill_rate=1.0 / rate_limit_seconds)
+        self.studio_bucket = TokenBucket(capacity=burst, refill_rate=1.0 / rate_limit_seconds)
+        
+        # Known-exhausted providers are skipped outright (cooldown 60s, doubling up to 15 min)
+        self.vertex_breaker = CircuitBreaker(fail_threshold=3, reset_timeout=60, name="vertex-image", max_reset_timeout=900)
+        self.studio_breaker = CircuitBreaker(fail_threshold=3, reset_timeout=60, name="ai-studio-image", max_reset_timeout=900)
         
-        # Initialize Vertex AI client (global endpoint)
-        vertexai.init(project=project_id, location="us-central1")
-        self.vertex_client = genai.Client(
-            vertexai=True, 
-            project=project_id, 
-            location="global"
-        )
+        # Identical prompts are served from disk instead of paying for another generation
+        self.cache = cache or LLMCache()
+        
+        # Vertex AI client (global endpoint), shared with other generators in this process
+        self.vertex_client = vertex_client(project_id, "global")
         
         # Initialize AI Studio client (if key available)
         self.ai_studio_client = None
         if self.ai_studio_key:
-            self.ai_studio_client = genai.Client(api_key=self.ai_studio_key)
+            self.ai_studio_client = studio_client(self.ai_studio_key)
             print("✅ AI Studio fallback enabled")
         else:
             print("⚠️  AI Studio key not found - fallback disabled")
         
-        print(f"⏱️  Rate limiting: {rate_limit_seconds}s cooldown between requests")
+        print(f"⏱️  Rate limiting: bursts of {burst}, then {rate_limit_seconds}s between requests")
     
-    def generate_image(self, prompt: str, retries: int = 2) -> dict:
+    def generate_image(self, prompt: str, retries: int = 2, use_cache: bool = True) -> dict:
         """
         Generate an image with automatic fallback and rate limiting
+        Repeated prompts come from the local cache (source "cache") unless use_cache=False
         
         Returns:
             dict with keys: success, source, data, mime_type, error
         """
-        # Check rate limit for Vertex AI
-        if self.last_vertex_request:
-            time_since_last = (datetime.now() - self.last_vertex_request).total_seconds()
-            if time_since_last < self.rate_limit_seconds:
-                wait_time = self.rate_limit_seconds - time_since_last
+        key = LLMCache.key(model=Config.MODEL_IMAGE, prompt=prompt, temperature=1.0)
+        if use_cache:
+            data = self.cache.get(key)
+            if data is not None:
+                print("♻️  Image served from cache")
+                return {
+                    "success": True,
+                    "source": "cache",
+                    "data": data,
+                    "mime_type": "image/png" if data.startswith(b"\x89PNG") else "image/jpeg",
+                    "error": None
+                }
+        
+        result = self._generate_image(prompt)
+        if result["success"]:
+            self.cache.put(key, result["data"])
+        return result
+    
+    def _generate_image(self, prompt: str) -> dict:
+        # Check rate limit for Vertex AI (no point pacing a call the breaker will short-circuit)
+        if not self.vertex_breaker.is_open:
+            wait_time = self.vertex_bucket.take()
+            if wait_time > 0:
                 print(f"⏳ Rate limit: Waiting {wait_time:.1f}s before next request...")
                 time.sleep(wait_time)
         
-        # Try Vertex AI first
-        print(f"🎨 Attempting to generate image via Vertex AI (global)...")
-        try:
-            # Update request timestamp
-            self.last_vertex_request = datetime.now()
-            
-            response = self.vertex_client.models.generate_content(
+        def vertex_call():
+            limiter.allow(f"vertex:{Config.MODEL_IMAGE}", _IMAGE_QUOTA["rpm"], _IMAGE_QUOTA["rpd"])
+            return self.vertex_client.models.generate_content(
                 model=Config.MODEL_IMAGE,
                 contents=[prompt],
                 config=types.GenerateContentConfig(temperature=1.0)
             )
+        
+        # Try Vertex AI first
+        print(f"🎨 Attempting to generate image via Vertex AI (global)...")
+        try:
+            response = self.vertex_breaker.call(vertex_call)
             
             # Extract image from response
             if response.candidates:
@@ -93,8 +122,8 @@ class DualModeImageGenerator:
             error_msg = str(vertex_error)
             print(f"❌ Vertex AI failed: {error_msg}")
             
-            # Check if it's a quota error (429)
-            if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
+            # Check if it's a quota error (429), or Vertex is already known to be exhausted (breaker open / daily cap spent)
+            if isinstance(vertex_error, (CircuitOpenError, RateLimitExceeded)) or "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
                 print("⚡ Quota exhausted - switching to AI Studio fallback...")
                 
                 if not self.ai_studio_client:
@@ -109,23 +138,23 @@ class DualModeImageGenerator:
                 # Fallback to AI Studio
                 try:
                     # Check AI Studio rate limit
-                    if self.last_ai_studio_request:
-                        time_since_last = (datetime.now() - self.last_ai_studio_request).total_seconds()
-                        if time_since_last < self.rate_limit_seconds:
-                            wait_time = self.rate_limit_seconds - time_since_last
+                    if not self.studio_breaker.is_open:
+                        wait_time = self.studio_bucket.take()
+                        if wait_time > 0:
                             print(f"⏳ AI Studio rate limit: Waiting {wait_time:.1f}s...")
                             time.sleep(wait_time)
                     
                     print("🔄 Generating via Google AI Studio...")
                     
-                    # Update AI Studio timestamp
-                    self.last_ai_studio_request = datetime.now()
+                    def studio_call():
+                        limiter.allow(f"ai_studio:{Config.MODEL_IMAGE}", _IMAGE_QUOTA["rpm"], _IMAGE_QUOTA["rpd"])
+                        return self.ai_studio_client.models.generate_content(
+                            model=Config.MODEL_IMAGE,
+                            contents=[prompt],
+                            config=types.GenerateContentConfig(temperature=1.0)
+                        )
                     
-                    response = self.ai_studio_client.models.generate_content(
-                        model=Config.MODEL_IMAGE,
-                        contents=[prompt],
-                        config=types.GenerateContentConfig(temperature=1.0)
-                    )
+                    response = self.studio_breaker.call(studio_call)
                     
                     if response.candidates:
                         for part in response.candidates[0].content.parts:
@@ -7,32 +7,56 @@ import time
 import json
 import base64
 import random
+import concurrent.futures
 from pathlib import Path
 from typing import List, Optional
 from google import genai
 from google.genai import types
 from visions.core.config import Config
+from visions.core.genai_pool import vertex_client
+from visions.core.llm_cache import LLMCache
+from visions.core.rate_limit import RATE_LIMITS, limiter
+from visions.core.resilience import is_quota, retry_call
+
+_IMAGE_QUOTA = RATE_LIMITS["gemini-3-pro-image"]
+_VEO_QUOTA = RATE_LIMITS["veo-3-standard"]
 
 # Configuration
 OUTPUT_DIR = Path("outputs/cinema")
 
-def retry_with_backoff(func, retries=5, initial_delay=5):
+# Lens Logic (built once, not per shot)
+_LENS_SPECS = {
+    "standard": "35mm prime lens, natural depth of field.",
+    "anamorphic": "2.39:1 anamorphic lens, oval bokeh, blue horizontal lens flares, cinematic wide compression.",
+    "tilt-shift": "Tilt-shift lens, miniature effect, extreme selective focus, sharp center with blurred top/bottom.",
+    "macro": "100mm macro lens, extreme close-up, microscopic detail, paper-thin depth of field.",
+    "wide": "14mm wide-angle lens, slight barrel distortion, deep focus, expansive environment.",
+    "reality_bleed": "Practical projection mapping, volumetric blue hour lighting, digital noise overlay on physical surfaces, high contrast chiaroscuro."
+}
+
+_SHOT_TEMPLATE = (
+    "CINEMATIC SHOT: {shot_type}. "
+    "Lens Specification: {spec}. "
+    "Character: {character_description}. "
+    "Action/Angle: {angle_prompt}. "
+    "Photorealistic, 8k, movie still."
+)
+
+# Module-level (not on VisionsCinema) so the class stays picklable for deploys
+_shot_cache = LLMCache(OUTPUT_DIR / ".cache")
+
+def retry_with_backoff(func, retries=5, initial_delay=5, max_delay=120, max_total_sleep=300):
     """
     Simple retry decorator for Quota handling.
+    Only quota rejections are retried: anything else (e.g. a blip while polling a paid Veo
+    operation) is raised rather than re-launching the whole generation. Sleeps for the
+    server's retry hint, otherwise delay * uniform(0.5, 1.5) with the delay doubling up to
+    `max_delay`, and gives up once `max_total_sleep` seconds would be exceeded.
     """
     def wrapper(*args, **kwargs):
-        delay = initial_delay
-        for i in range(retries):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                if "429" in str(e) or "quota" in str(e).lower() or "resource exhausted" in str(e).lower():
-                    print(f"⚠️ Quota hit. Retrying in {delay}s... (Attempt {i+1}/{retries})")
-                    time.sleep(delay)
-                    delay *= 2 # Exponential backoff
-                else:
-                    raise e
-        raise Exception("Max retries exceeded for Quota.")
+        return retry_call(lambda: func(*args, **kwargs), retries=retries, base_delay=initial_delay,
+                          max_delay=max_delay, max_total_sleep=max_total_sleep,
+                          retry_if=is_quota, jitter=(0.5, 1.5))
     return wrapper
 
 class VisionsCinema:
@@ -40,25 +64,19 @@ class VisionsCinema:
         self.project_id = Config.VERTEX_PROJECT_ID
         self.location = Config.VERTEX_LOCATION
         # LAZY initialization - DON'T create clients here (causes pickling errors on deploy)
-        self._client = None
-        self._global_client = None
         
         # Ensure output directory exists
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     @property
     def client(self):
-        """Regional client for Veo (us-central1) - lazy loaded."""
-        if self._client is None:
-            self._client = genai.Client(vertexai=True, project=self.project_id, location=self.location)
-        return self._client
+        """Regional client for Veo (us-central1) - lazy loaded, shared process-wide."""
+        return vertex_client(self.project_id, self.location)
     
     @property
     def global_client(self):
-        """Global client for Gemini 3 Pro Image - lazy loaded."""
-        if self._global_client is None:
-            self._global_client = genai.Client(vertexai=True, project=self.project_id, location="global")
-        return self._global_client
+        """Global client for Gemini 3 Pro Image - lazy loaded, shared process-wide."""
+        return vertex_client(self.project_id, "global")
         
     @retry_with_backoff
     def generate_character_base(self, prompt: str, name: str) -> str:
@@ -70,6 +88,7 @@ class VisionsCinema:
         
         # Use Gemini 3 Pro Image Preview (Nano Banana Pro)
         # Note: Native image gen uses generate_content, not generate_images
+        limiter.allow(f"vertex:{Config.MODEL_IMAGE}", _IMAGE_QUOTA["rpm"], _IMAGE_QUOTA["rpd"])
         response = self.global_client.models.generate_content(
             model=Config.MODEL_IMAGE,
             contents=prompt,
@@ -89,53 +108,74 @@ class VisionsCinema:
             
         raise Exception("Failed to generate base character (No image data returned)")
 
-        @retry_with_backoff
-        def generate_shot(self, base_image_path: str, shot_type: str, angle_prompt: str, character_description: str, lens_type: str = "standard") -> str:
-            """
-            Step 3: Camera Angle Control using Gemini 3 Pro Image (generate_images)
-            """
-            print(f"📸 Generating Shot: {shot_type} (Lens: {lens_type})...")
-            
-            # Lens Logic
-            lens_specs = {
-                "standard": "35mm prime lens, natural depth of field.",
-                "anamorphic": "2.39:1 anamorphic lens, oval bokeh, blue horizontal lens flares, cinematic wide compression.",
-                "tilt-shift": "Tilt-shift lens, miniature effect, extreme selective focus, sharp center with blurred top/bottom.",
-                "macro": "100mm macro lens, extreme close-up, microscopic detail, paper-thin depth of field.",
-                "wide": "14mm wide-angle lens, slight barrel distortion, deep focus, expansive environment.",
-                "reality_bleed": "Practical projection mapping, volumetric blue hour lighting, digital noise overlay on physical surfaces, high contrast chiaroscuro."
-            }
-            
-            spec = lens_specs.get(lens_type, lens_specs["standard"])
-            
-            full_prompt = (
-                f"CINEMATIC SHOT: {shot_type}. "
-                f"Lens Specification: {spec}. "
-                f"Character: {character_description}. "
-                f"Action/Angle: {angle_prompt}. "
-                "Photorealistic, 8k, movie still."
-            )
-    
-            # Using generate_content for Native Image Synthesis (Nano Banana Pro)
-            response = self.global_client.models.generate_content(
-                model=Config.MODEL_IMAGE,
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="image/png",
-                    media_resolution=Config.MEDIA_RES_HIGH
-                )
+    @retry_with_backoff
+    def generate_shot(self, base_image_path: str, shot_type: str, angle_prompt: str, character_description: str, lens_type: str = "standard", use_cache: bool = True) -> str:
+        """
+        Step 3: Camera Angle Control using Gemini 3 Pro Image (generate_images)
+        A prompt that was already rendered is re-saved from the local cache unless use_cache=False.
+        """
+        print(f"📸 Generating Shot: {shot_type} (Lens: {lens_type})...")
+        
+        full_prompt = _SHOT_TEMPLATE.format(
+            shot_type=shot_type,
+            spec=_LENS_SPECS.get(lens_type, _LENS_SPECS["standard"]),
+            character_description=character_description,
+            angle_prompt=angle_prompt,
+        )
+        # ns timestamp + lens: parallel shots of one type must not overwrite each other
+        filepath = OUTPUT_DIR / f"shot_{shot_type.replace(' ','_')}_{lens_type}_{time.time_ns()}.png"
+
+        cache_key = LLMCache.key(model=Config.MODEL_IMAGE, prompt=full_prompt, mime="image/png",
+                                 media_resolution=Config.MEDIA_RES_HIGH)
+        cached = _shot_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            filepath.write_bytes(cached)
+            print(f"♻️  Shot served from cache: {filepath}")
+            return str(filepath)
+
+        # Using generate_content for Native Image Synthesis (Nano Banana Pro)
+        limiter.allow(f"vertex:{Config.MODEL_IMAGE}", _IMAGE_QUOTA["rpm"], _IMAGE_QUOTA["rpd"])
+        response = self.global_client.models.generate_content(
+            model=Config.MODEL_IMAGE,
+            contents=full_prompt,
+            config=types.GenerateContentConfig(
+                response_mime_type="image/png",
+                media_resolution=Config.MEDIA_RES_HIGH
             )
-            
-            if response.parts:
-                for part in response.parts:
-                    if part.inline_data:
-                        filepath = OUTPUT_DIR / f"shot_{shot_type.replace(' ','_')}_{int(time.time())}.png"
-                        part.as_image().save(str(filepath))
-                        print(f"✅ Shot saved to: {filepath}")
-                        return str(filepath)
-            
-            print("❌ Failed to generate shot image.")
-            return None
+        )
+        
+        if response.parts:
+            for part in response.parts:
+                if part.inline_data:
+                    part.as_image().save(str(filepath))
+                    _shot_cache.put(cache_key, part.inline_data.data)  # Same bytes; no read-back from disk
+                    print(f"✅ Shot saved to: {filepath}")
+                    return str(filepath)
+        
+        print("❌ Failed to generate shot image.")
+        return None
+
+    def generate_shots(self, specs: List[dict], max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Generates several shots side by side: each is a multi-second, network-bound call,
+        so a storyboard takes roughly one shot's latency instead of the sum.
+        `specs` are generate_shot keyword dicts; paths come back in the same order,
+        None for a shot that failed. The shared rate limiter still paces the calls.
+        """
+        if not specs:
+            return []
+
+        def run(spec: dict) -> Optional[str]:
+            try:
+                return self.generate_shot(**spec)
+            except Exception as e:
+                print(f"❌ Shot failed ({spec.get('shot_type')}): {e}")
+                return None
+
+        workers = max_workers or min(len(specs), _IMAGE_QUOTA["rpm"])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="visions-shot") as pool:
+            return list(pool.map(run, specs))
+
     @retry_with_backoff
     def animate_shot(self, image_path: str, prompt: str) -> str:
         """
@@ -145,6 +185,7 @@ class VisionsCinema:
         
         print("   Starting generation operation...")
         # Use types.Image.from_file as per SDK reference
+        limiter.allow("vertex:veo-3.1-generate-preview", _VEO_QUOTA["rpm"], _VEO_QUOTA["rpd"])
         operation = self.client.models.generate_videos(
             model="veo-3.1-generate-preview",
             prompt=prompt,
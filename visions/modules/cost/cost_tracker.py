@@ -19,7 +19,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
+from functools import cached_property
 from visions.core.config import Config
+from visions.core.rate_limit import RATE_LIMITS
 
 try:
     from rich.console import Console
@@ -173,6 +175,12 @@ PRICING = {
 
 @dataclass
 class Credit:
+    """
+    Derived figures are computed once and cached against a single clock sample
+    (`_now`); call `refresh()` after changing `remaining` or to re-read the clock.
+    There is no implicit sample: date figures read before any `refresh()` raise, so a
+    long-lived process can't silently keep using its import-time clock.
+    """
     name: str
     original: float
     remaining: float
@@ -180,44 +188,59 @@ class Credit:
     expiry: datetime
     duration_days: int  # Total duration in days
     status: str  # "active", "expired_but_working", "expired"
+    _now: Optional[datetime] = field(default=None, repr=False, compare=False)
     
-    @property
+    _DERIVED = ("used", "percent_remaining", "days_until_expiry", "days_elapsed", "days_remaining",
+                "is_active", "daily_burn_limit", "ideal_remaining", "burn_status")
+    
+    def refresh(self, now: Optional[datetime] = None):
+        """Drop cached figures; `now` lets a whole render share one timestamp."""
+        self._now = now or datetime.now()
+        for name in self._DERIVED:
+            self.__dict__.pop(name, None)
+    
+    def _clock(self) -> datetime:
+        if self._now is None:
+            raise RuntimeError(f"Credit '{self.name}': call refresh() before reading date figures")
+        return self._now
+    
+    @cached_property
     def used(self) -> float:
         return self.original - self.remaining
     
-    @property
+    @cached_property
     def percent_remaining(self) -> float:
         return (self.remaining / self.original) * 100 if self.original > 0 else 0
     
-    @property
+    @cached_property
     def days_until_expiry(self) -> int:
-        return (self.expiry - datetime.now()).days
+        return (self.expiry - self._clock()).days
     
-    @property
+    @cached_property
     def days_elapsed(self) -> int:
-        return (datetime.now() - self.start_date).days
+        return (self._clock() - self.start_date).days
     
-    @property
+    @cached_property
     def days_remaining(self) -> int:
         return max(0, self.days_until_expiry)
     
-    @property
+    @cached_property
     def is_active(self) -> bool:
         return self.status in ["active", "expired_but_working"]
     
-    @property
+    @cached_property
     def daily_burn_limit(self) -> float:
         """Maximum daily spend to use credits evenly over duration."""
         return self.original / self.duration_days
     
-    @property
+    @cached_property
     def ideal_remaining(self) -> float:
         """What we should have remaining if burning evenly."""
         if self.days_remaining <= 0:
             return 0
         return self.daily_burn_limit * self.days_remaining
     
-    @property
+    @cached_property
     def burn_status(self) -> str:
         """Are we on track, over, or under budget?"""
         if self.remaining > self.ideal_remaining + 1:
@@ -260,6 +283,14 @@ CREDITS = [
     ),
 ]
 
+
+def refresh_credits(now: Optional[datetime] = None) -> datetime:
+    """Re-sample the clock for every credit (once per render/estimate); returns the shared sample."""
+    now = now or datetime.now()
+    for credit in CREDITS:
+        credit.refresh(now)
+    return now
+
 # ============================================================================
 # DAILY BURN LIMITS
 # ============================================================================
@@ -279,30 +310,8 @@ BURN_LIMITS = {
 # ============================================================================
 # These are hard caps regardless of budget!
 
-RATE_LIMITS = {
-    # Gemini 3
-    "gemini-3-pro": {"rpm": 25, "tpm": 1_000_000, "rpd": 250},
-    "gemini-3-pro-image": {"rpm": 20, "tpm": 100_000, "rpd": 250},
-    
-    # Gemini 2.5
-    "gemini-2.5-pro": {"rpm": 15, "tpm": 1_000_000, "rpd": 300},
-    "gemini-2.5-flash": {"rpm": 1000, "tpm": 1_000_000, "rpd": 10_000},
-    "gemini-2.5-flash-lite": {"rpm": 4000, "tpm": 4_000_000, "rpd": "unlimited"},
-    "gemini-2.5-flash-image": {"rpm": 500, "tpm": 500_000, "rpd": 2000},
-    
-    # Gemini 2.0
-    "gemini-2.0-flash": {"rpm": 2000, "tpm": 4_000_000, "rpd": "unlimited"},
-    "gemini-2.0-flash-lite": {"rpm": 4000, "tpm": 4_000_000, "rpd": "unlimited"},
-    
-    # Imagen 4
-    "imagen-4-fast": {"rpm": 10, "rpd": 70},
-    "imagen-4-standard": {"rpm": 10, "rpd": 70},
-    "imagen-4-ultra": {"rpm": 5, "rpd": 30},
-    
-    # Veo 3
-    "veo-3-standard": {"rpm": 2, "rpd": 10},
-    "veo-3-fast": {"rpm": 2, "rpd": 10},
-}
+# The table lives in visions.core.rate_limit so the runtime limiter can enforce it
+# without importing this dashboard module.
 
 # ============================================================================
 # IMAGE GENERATION COSTS (Official ai.google.dev pricing - Dec 2025)
@@ -571,6 +580,7 @@ def show_credits():
     
     total_remaining = 0
     total_original = 0
+    now = refresh_credits()  # One clock sample for the whole render
     
     for credit in CREDITS:
         # Status emoji
@@ -611,7 +621,7 @@ def show_credits():
     percent_remaining = (total_remaining / total_original * 100) if total_original > 0 else 0
     
     # Calculate days elapsed since start
-    days_elapsed = (datetime.now() - START_DATE).days
+    days_elapsed = (now - START_DATE).days
     
     summary = f"""
 [bold]Total Original:[/bold]  ${total_original:,.2f}
@@ -750,6 +760,7 @@ def estimate_cost(num_queries: int, query_type: str = "mixed"):
     total_cost = num_queries * cost_per
     
     # How long will credits last
+    refresh_credits()
     total_credits = sum(c.remaining for c in CREDITS if c.is_active)
     daily_queries = num_queries
     daily_cost = total_cost
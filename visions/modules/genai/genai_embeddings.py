@@ -103,6 +103,27 @@ class GenAIEmbeddings(Embeddings):
                     
         return all_embeddings
 
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed many queries with one RETRIEVAL_QUERY request per 250 texts.
+           Normalized like embed_query.
+        """
+        import numpy as np
+        config = types.EmbedContentConfig(
+            task_type="RETRIEVAL_QUERY",
+            output_dimensionality=self.output_dimensionality
+        )
+        all_embeddings = []
+        for i in range(0, len(texts), 250):  # Vertex per-request instance limit
+            result = self.client.models.embed_content(
+                model=self.model_name,
+                contents=texts[i:i + 250],
+                config=config
+            )
+            arr = np.array([e.values for e in result.embeddings], dtype=np.float32)
+            norms = np.linalg.norm(arr, axis=1, keepdims=True)
+            all_embeddings.extend((arr / np.where(norms > 0, norms, 1)).tolist())
+        return all_embeddings
+
     def embed_query(self, text: str) -> List[float]:
         """Embed a single query with RETRIEVAL_QUERY optimization.
            Normalizes embedding for 768 dim as per docs.
@@ -4,13 +4,37 @@ import logging
 import sqlite3
 import time
 import datetime
+import atexit
+import threading
+import concurrent.futures
+import weakref
 from pathlib import Path
+try:
+    import orjson
+    _json_dumps = orjson.dumps  # bytes; upload_from_string accepts either
+except ImportError:
+    _json_dumps = json.dumps
 from google.cloud import storage
 from google.cloud import bigquery
 from visions.core.config import Config
 
 logger = logging.getLogger("visions-memory")
 
+# Shared pool for the GCS/BigQuery fan-out (module-level, like agent's _bg_pool: one pool however many managers)
+_io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="visions-mem")
+# Live managers, held weakly so the exit hook never keeps one alive
+_live_managers = weakref.WeakSet()
+
+
+def _flush_all():
+    """Commit every live manager's buffered BigQuery rows before the process exits."""
+    for manager in list(_live_managers):
+        manager.flush_bq()
+
+
+atexit.register(_flush_all)
+
+
 class CloudMemoryManager:
     """
     Hybrid Memory Manager:
@@ -30,6 +54,10 @@ class CloudMemoryManager:
         self._bq_client = None
         self.bq_dataset = Config.BIGQUERY_DATASET
         self.bq_table = Config.BIGQUERY_TABLE
+        self._bq_rows = []  # Pending rows, committed together by flush_bq
+        self._bq_lock = threading.Lock()
+        self._bq_timer = None
+        _live_managers.add(self)  # Buffered rows are flushed at exit
         
         # Local SQL Setup
         import tempfile
@@ -84,8 +112,13 @@ class CloudMemoryManager:
         except Exception as e:
             logger.warning(f"Markdown Logging Failed: {e}")
 
-    def save_interaction(self, user_id: str, prompt: str, response: str):
-        """Save interaction to all three memory tiers + Markdown Log."""
+    def save_interaction(self, user_id: str, prompt: str, response: str, fan_out: bool = True):
+        """
+        Save interaction to all three memory tiers + Markdown Log.
+        Callers already running on a background pool pass fan_out=False: GCS and BigQuery
+        are then written in the calling thread, since a nested executor refuses new work
+        once interpreter shutdown has begun and the save would be lost.
+        """
         timestamp = time.time()
         
         # A. Local SQL (Immediate)
@@ -102,7 +135,18 @@ class CloudMemoryManager:
         # D. Markdown Log (User Visibility)
         self._log_to_markdown(user_id, prompt, response, timestamp)
 
-        # B. GCS (Blob Persistence)
+        # B + C. GCS and BigQuery are independent round-trips; run them side by side
+        if fan_out:
+            concurrent.futures.wait([
+                _io_pool.submit(self._save_to_gcs, user_id, prompt, response, timestamp),
+                _io_pool.submit(self._save_to_bq, user_id, prompt, response)
+            ])
+        else:
+            self._save_to_gcs(user_id, prompt, response, timestamp)
+            self._save_to_bq(user_id, prompt, response)
+
+    def _save_to_gcs(self, user_id: str, prompt: str, response: str, timestamp: float):
+        """B. GCS (Blob Persistence)"""
         try:
             bucket = self._get_gcs()
             blob_name = f"logs/{user_id}/{int(timestamp)}.json"
@@ -115,33 +159,53 @@ class CloudMemoryManager:
                 "response": response,
                 "iso_time": datetime.datetime.now().isoformat()
             }
-            blob.upload_from_string(json.dumps(data), content_type="application/json")
+            blob.upload_from_string(_json_dumps(data), content_type="application/json")
         except Exception as e:
             logger.warning(f"GCS Memory Save Failed: {e}")
-            
-        # C. BigQuery (Structured Storage)
+
+    def _save_to_bq(self, user_id: str, prompt: str, response: str):
+        """C. BigQuery (Structured Storage) - buffered, flushed as one streaming insert."""
+        row = {
+            "user_id": user_id,
+            "prompt": prompt,
+            "response": response,
+            "timestamp": datetime.datetime.now().isoformat()
+        }
+        with self._bq_lock:
+            self._bq_rows.append(row)
+            pending = len(self._bq_rows)
+            if pending == 1:
+                # First row of a batch arms the flush timer so quiet periods still drain
+                self._bq_timer = threading.Timer(Config.BIGQUERY_FLUSH_SECONDS, self.flush_bq)
+                self._bq_timer.daemon = True
+                self._bq_timer.start()
+        if pending >= Config.BIGQUERY_BATCH_SIZE:
+            self.flush_bq()
+
+    def flush_bq(self):
+        """Commit buffered BigQuery rows in a single insert_rows_json call."""
+        with self._bq_lock:
+            rows, self._bq_rows = self._bq_rows, []
+            timer, self._bq_timer = self._bq_timer, None
+        if timer:
+            timer.cancel()
+        if not rows:
+            return
         try:
             bq = self._get_bq()
             table_id = f"{self.project_id}.{self.bq_dataset}.{self.bq_table}"
             
-            rows_to_insert = [{
-                "user_id": user_id,
-                "prompt": prompt,
-                "response": response,
-                "timestamp": datetime.datetime.now().isoformat()
-            }]
-            
             # Note: In production, you would check if table exists or stream. 
             # This assumes the dataset/table structure exists or BQ auto-creates if configured.
             # For robustness, we catch the error if table doesn't exist.
-            errors = bq.insert_rows_json(table_id, rows_to_insert)
+            errors = bq.insert_rows_json(table_id, rows)
             if errors:
                 logger.warning(f"BigQuery Insert Errors: {errors}")
                 
         except Exception as e:
             # Common error: Table or Dataset not found. 
             # Not blocking the agent flow.
-            logger.warning(f"BigQuery Memory Save Failed: {e}")
+            logger.warning(f"BigQuery Memory Save Failed ({len(rows)} rows): {e}")
 
     def get_recent_context(self, user_id: str, limit: int = 5):
         """Retrieve recent context primarily from Local SQL (fast)."""
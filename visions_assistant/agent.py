@@ -2,7 +2,6 @@
 # Pure bridge to the Core Rhea Noir Engine
 
 import os
-import base64
 import logging
 from typing import Optional, Dict, Any
 
@@ -28,16 +27,17 @@ def get_engine():
 def get_chat_response(user_message: str, image_path: str = None, video_path: str = None, user_id: str = "default_user", config: dict = None):
     """
     Standardized entry for the Fleet Server.
-    Maps file paths to base64 and proxies to the core engine.
+    Reads file inputs and proxies to the in-process core engine.
     """
     engine = get_engine()
     
     # 1. Handle Visual Inputs
-    image_base64 = None
+    # Raw bytes: the engine is in-process, so a base64 round-trip would only burn CPU
+    image_bytes = None
     if image_path and os.path.exists(image_path):
         try:
             with open(image_path, "rb") as f:
-                image_base64 = base64.b64encode(f.read()).decode('utf-8')
+                image_bytes = f.read()
         except Exception as e:
             logger.error(f"Error reading image: {e}")
 
@@ -58,9 +58,9 @@ def get_chat_response(user_message: str, image_path: str = None, video_path: str
     try:
         return engine.query(
             question=user_message,
-            image_base64=image_base64,
             user_id=user_id,
-            config=config
+            config=config,
+            image_bytes=image_bytes
         )
     except Exception as e:
         logger.error(f"Engine Query Failure: {e}")